@@ -0,0 +1,32 @@
+"""
+Ahead-of-time build of the fused TCCM kernel.
+
+Run once at build/deploy time:
+
+    python -m alpha_scanner._tccm_aot
+
+This writes a `_tccm_native` extension module next to this file. When it
+is importable, `tccm` uses it instead of the JIT kernel, so scheduled
+runs and calibration workers skip JIT warmup and do not need numba at
+runtime. Requires numba (with its `pycc` module) and a C compiler.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from numba.pycc import CC
+
+from .tccm_kernels import costs_and_capacity_loop
+
+cc = CC("_tccm_native")
+cc.output_dir = str(Path(__file__).resolve().parent)
+
+cc.export(
+    "costs_and_capacity_loop",
+    "void(i8[:], f8[:], f8[:], f8[:], f8[:], f8[:], i8, f8, f8, f8, f8[:], f8[:])",
+)(costs_and_capacity_loop.py_func)
+
+
+if __name__ == "__main__":
+    cc.compile()
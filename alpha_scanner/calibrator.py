@@ -13,15 +13,32 @@ Phase 2 (Production, to be extended):
 
 from __future__ import annotations
 
+import os
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from typing import Dict, Iterable, Tuple
+from typing import Dict, Iterable, Optional, Tuple
 
 import numpy as np
 import pandas as pd
 
 from .factor_engine import compute_factor_matrix
-from .tccm import TCCMConfig, estimate_trade_costs
-from .factors.utils import ensure_multiindex
+from .market_arrays import MarketArrays
+from .tccm import (
+    DEFAULT_TCCM,
+    TCCMConfig,
+    estimate_trade_costs,
+    trade_costs_from_arrays,
+)
+from .factors.utils import (
+    Panels,
+    build_panels,
+    ensure_multiindex,
+    move_mean,
+    move_std,
+    rolling_std,
+    shift_grouped,
+    shift_rows,
+)
 
 
 @dataclass
@@ -32,6 +49,78 @@ class BacktestConfig:
 
     volatility_target: float = 0.10  # target annualized volatility (placeholder)
     tc_config: TCCMConfig | None = None
+    n_jobs: Optional[int] = 1  # candidate workers; None = all cores
+
+
+@dataclass
+class PanelContext:
+    """
+    Dense (date x ticker) backtest inputs.
+
+    Built once per calibration when every ticker has a row on every date.
+    Each candidate is then scored entirely on these 2D arrays; only the
+    per-date equity curve is materialized as a Series.
+    """
+
+    dates: pd.Index
+    tickers: pd.Index
+    close: np.ndarray
+    volume: np.ndarray
+    asset_returns: np.ndarray
+    vol_proxy: np.ndarray
+    adv: np.ndarray
+    factor_scores: Dict[str, np.ndarray]
+
+    @classmethod
+    def from_panels(
+        cls,
+        panels: Panels,
+        factor_scores: pd.DataFrame,
+        adv_window: int,
+    ) -> "PanelContext":
+        asset_returns = _compute_returns_panel(panels.close)
+        return cls(
+            dates=panels.dates,
+            tickers=panels.tickers,
+            close=panels.close,
+            volume=panels.volume,
+            asset_returns=asset_returns,
+            vol_proxy=move_std(asset_returns, 20),
+            adv=move_mean(panels.volume, adv_window),
+            factor_scores={
+                col: panels.view(factor_scores[col]) for col in factor_scores.columns
+            },
+        )
+
+
+@dataclass
+class _PreparedBacktest:
+    """
+    Weight-independent backtest inputs.
+
+    Everything here depends only on the data, so it is computed once and
+    shared by every candidate weight vector. Dense universes carry a
+    `panel`; ragged ones keep the long (date, ticker) Series plus a
+    ticker-contiguous `market` (MarketArrays) of prices/volume/volatility
+    for TCCM.
+
+    Ragged universes are backtested as if on the full (date x ticker)
+    grid: a missing row holds a zero position. `follows_prev` marks rows
+    whose ticker also has a row on the previous date, and `gap_exit`
+    gives, for rows followed by a missing date, the position of that date
+    in `dates` (-1 otherwise), where the forced exit is traded.
+    """
+
+    factor_scores: pd.DataFrame
+    prices: pd.Series
+    volume: pd.Series
+    asset_returns: Optional[pd.Series] = None
+    vol_proxy: Optional[pd.Series] = None
+    panel: Optional[PanelContext] = None
+    market: Optional[MarketArrays] = None
+    dates: Optional[pd.Index] = None
+    follows_prev: Optional[np.ndarray] = None
+    gap_exit: Optional[np.ndarray] = None
 
 
 def _positions_from_scores(
@@ -43,53 +132,146 @@ def _positions_from_scores(
     Very simplified volatility targeting:
     - Normalize scores to sum of absolutes = 1 per date.
     - Scale to constant notional (1.0).
+
+    `scores` and `prices` share the same (date, ticker) index.
     """
-    scores_wide = scores.unstack("ticker")
-    norm = scores_wide.abs().sum(axis=1).replace(0, np.nan)
-    weights = scores_wide.div(norm, axis=0).fillna(0.0)
+    norm = scores.abs().groupby(level="date").transform("sum")
+    weights = (scores / norm.replace(0, np.nan)).fillna(0.0)
 
     capital = 1.0
     dollar_positions = weights * capital
 
-    prices_wide = prices.unstack("ticker")
-    shares = dollar_positions / prices_wide.replace(0, np.nan)
+    shares = dollar_positions / prices.replace(0, np.nan)
     shares = shares.fillna(0.0)
 
-    return shares.stack().rename("position")
+    return shares.rename("position")
 
 
-def _compute_returns(prices: pd.Series) -> pd.Series:
+def _grid_positions(index: pd.MultiIndex) -> Tuple[pd.Index, np.ndarray, np.ndarray]:
+    """
+    Where the rows of a ragged (date, ticker) index sit on the full grid.
+
+    Returns `(dates, follows_prev, gap_exit)` as described on
+    `_PreparedBacktest`.
+    """
+    dates = index.unique(level="date").sort_values()
+    n_dates = len(dates)
+    date_pos = dates.get_indexer(index.get_level_values("date"))
+    ticker_codes = np.asarray(index.codes[index.names.index("ticker")])
+
+    # Keys of every observed (ticker, date) cell, then probe the neighbours.
+    keys = ticker_codes.astype(np.int64) * (n_dates + 1) + date_pos
+    follows_prev = np.isin(keys - 1, keys) & (date_pos > 0)
+    has_next = np.isin(keys + 1, keys) | (date_pos == n_dates - 1)
+    gap_exit = np.where(has_next, -1, date_pos + 1)
+    return dates, follows_prev, gap_exit
+
+
+def _compute_returns(prices: pd.Series, follows_prev: np.ndarray) -> pd.Series:
     """
     Daily log returns per (date, ticker).
+
+    Stays in long format: the previous price comes from a within-ticker
+    shift rather than a wide pivot. Only rows whose ticker also traded on
+    the previous date get a return, as on the full (date x ticker) grid.
     """
-    prices_wide = prices.unstack("ticker")
-    rets = np.log(prices_wide / prices_wide.shift(1))
-    return rets.stack().rename("ret")
+    with np.errstate(divide="ignore", invalid="ignore"):
+        log_p = np.log(prices)
+    rets = (log_p - shift_grouped(log_p, 1)).where(follows_prev)
+    return rets.rename("ret")
 
 
-def backtest_weights(
+def _positions_from_scores_panel(
+    scores: np.ndarray,
+    volatility_target: float,
+    prices: np.ndarray,
+) -> np.ndarray:
+    """
+    `_positions_from_scores` on (date x ticker) arrays.
+    """
+    norm = np.nansum(np.abs(scores), axis=1, keepdims=True)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        weights = scores / np.where(norm == 0, np.nan, norm)
+        weights = np.where(np.isnan(weights), 0.0, weights)
+
+        capital = 1.0
+        shares = weights * capital / np.where(prices == 0, np.nan, prices)
+    return np.where(np.isnan(shares), 0.0, shares)
+
+
+def _compute_returns_panel(close: np.ndarray) -> np.ndarray:
+    """
+    `_compute_returns` on a (date x ticker) array.
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        log_p = np.log(close)
+    return log_p - shift_rows(log_p, 1)
+
+
+def _prepare_backtest(
     df: pd.DataFrame,
-    weights: Dict[str, float],
     bt_config: BacktestConfig,
-) -> Tuple[float, pd.Series]:
+) -> _PreparedBacktest:
     """
-    Run a very simplified backtest for a given factor weight vector.
-
-    Returns
-    -------
-    sharpe_net:
-        Cost-adjusted Sharpe ratio (annualized).
-    equity_curve:
-        Series of cumulative returns.
+    Compute the factor matrix, returns and volatility proxy for `df`.
     """
     df = ensure_multiindex(df)
 
-    # Lazily create default TCCMConfig to avoid mutable dataclass defaults
     if bt_config.tc_config is None:
-        bt_config.tc_config = TCCMConfig()
+        bt_config.tc_config = DEFAULT_TCCM
 
     factor_scores = compute_factor_matrix(df)
 
+    prices = df["close"]
+    volume = df.get("volume", pd.Series(index=df.index, dtype=float))
+
+    # Accounting stays in float64 even though factors run in float32.
+    panels = build_panels(df, dtype=np.float64)
+    if panels is not None:
+        return _PreparedBacktest(
+            factor_scores=factor_scores,
+            prices=prices,
+            volume=volume,
+            panel=PanelContext.from_panels(
+                panels, factor_scores, bt_config.tc_config.adv_window
+            ),
+        )
+
+    dates, follows_prev, gap_exit = _grid_positions(prices.index)
+    asset_returns = _compute_returns(prices, follows_prev)
+
+    # A window spanning a missing date holds a NaN return, so the
+    # volatility proxy is undefined there, as on the full grid.
+    vol_proxy = rolling_std(asset_returns, 20)
+
+    return _PreparedBacktest(
+        factor_scores=factor_scores,
+        prices=prices,
+        volume=volume,
+        asset_returns=asset_returns,
+        vol_proxy=vol_proxy,
+        market=MarketArrays.from_series(prices, volume, vol_proxy),
+        dates=dates,
+        follows_prev=follows_prev,
+        gap_exit=gap_exit,
+    )
+
+
+def _score_weights(
+    prepared: _PreparedBacktest,
+    weights: Dict[str, float],
+    bt_config: BacktestConfig,
+) -> Tuple[float, pd.Series]:
+    """
+    Backtest one weight vector on prepared inputs.
+    """
+    if prepared.panel is not None:
+        return _score_weights_panel(prepared.panel, weights, bt_config)
+
+    factor_scores = prepared.factor_scores
+    prices = prepared.prices
+    asset_returns = prepared.asset_returns
+
     composite = sum(
         w * factor_scores[col]
         for col, w in weights.items()
@@ -97,41 +279,84 @@ def backtest_weights(
     )
     composite.name = "composite_score"
 
-    prices = df["close"]
-    volume = df.get("volume", pd.Series(index=df.index, dtype=float))
-
-    asset_returns = _compute_returns(prices)
-
     positions = _positions_from_scores(
         composite, bt_config.volatility_target, prices
     )
-    positions_prev = positions.groupby(level="ticker").shift(1).fillna(0.0)
-
-    vol_proxy = (
-        asset_returns.groupby(level="ticker")
-        .rolling(window=20, min_periods=20)
-        .std()
-        .reset_index(level=0, drop=True)
+    # A missing previous date held a zero position.
+    positions_prev = (
+        shift_grouped(positions, 1).where(prepared.follows_prev, 0.0).fillna(0.0)
     )
 
     trade_costs = estimate_trade_costs(
         positions_prev=positions_prev,
         positions_next=positions,
-        prices=prices,
-        volume=volume,
-        volatility=vol_proxy,
+        prices=prepared.market,
         config=bt_config.tc_config,
     )
 
-    asset_returns_wide = asset_returns.unstack("ticker")
-    positions_prev_wide = positions_prev.unstack("ticker")
-    port_ret = (positions_prev_wide * asset_returns_wide).sum(axis=1)
+    # Positions, returns and costs share the (date, ticker) index, so the
+    # per-date portfolio totals are plain groupby sums on the long series.
+    port_ret = (positions_prev * asset_returns).groupby(level="date").sum()
 
     trade_costs_daily = (
-        trade_costs.unstack("ticker").sum(axis=1).reindex(port_ret.index).fillna(0.0)
+        trade_costs.groupby(level="date").sum().reindex(port_ret.index).fillna(0.0)
     )
+    commission = bt_config.tc_config.commission_per_share
+    if commission:
+        # Exits forced by a missing row pay commission on that date; with
+        # no price there, no impact is charged.
+        exiting = prepared.gap_exit >= 0
+        exit_costs = np.bincount(
+            prepared.gap_exit[exiting],
+            weights=np.abs(positions.to_numpy()[exiting]) * commission,
+            minlength=len(prepared.dates),
+        )
+        trade_costs_daily = trade_costs_daily + pd.Series(
+            exit_costs, index=prepared.dates
+        ).reindex(port_ret.index, fill_value=0.0)
     port_ret_net = port_ret - trade_costs_daily
 
+    return _sharpe_and_equity(port_ret_net)
+
+
+def _score_weights_panel(
+    panel: PanelContext,
+    weights: Dict[str, float],
+    bt_config: BacktestConfig,
+) -> Tuple[float, pd.Series]:
+    """
+    `_score_weights` on dense (date x ticker) arrays.
+    """
+    composite = sum(
+        w * panel.factor_scores[col]
+        for col, w in weights.items()
+        if col in panel.factor_scores
+    )
+
+    positions = _positions_from_scores_panel(
+        composite, bt_config.volatility_target, panel.close
+    )
+    positions_prev = np.nan_to_num(shift_rows(positions, 1), nan=0.0)
+
+    trade_costs = trade_costs_from_arrays(
+        delta_shares=np.abs(positions - positions_prev),
+        prices=panel.close,
+        adv=panel.adv,
+        volatility=panel.vol_proxy,
+        config=bt_config.tc_config,
+    )
+
+    port_ret = np.nansum(positions_prev * panel.asset_returns, axis=1)
+    trade_costs_daily = np.nansum(trade_costs, axis=1)
+    port_ret_net = pd.Series(port_ret - trade_costs_daily, index=panel.dates)
+
+    return _sharpe_and_equity(port_ret_net)
+
+
+def _sharpe_and_equity(port_ret_net: pd.Series) -> Tuple[float, pd.Series]:
+    """
+    Annualized Sharpe and cumulative equity curve from daily net returns.
+    """
     mu = port_ret_net.mean() * 252
     sigma = port_ret_net.std(ddof=0) * np.sqrt(252)
     sharpe = mu / sigma if sigma > 0 else 0.0
@@ -141,6 +366,42 @@ def backtest_weights(
     return float(sharpe), equity_curve
 
 
+def backtest_weights(
+    df: pd.DataFrame,
+    weights: Dict[str, float],
+    bt_config: BacktestConfig,
+) -> Tuple[float, pd.Series]:
+    """
+    Run a very simplified backtest for a given factor weight vector.
+
+    Returns
+    -------
+    sharpe_net:
+        Cost-adjusted Sharpe ratio (annualized).
+    equity_curve:
+        Series of cumulative returns.
+    """
+    prepared = _prepare_backtest(df, bt_config)
+    return _score_weights(prepared, weights, bt_config)
+
+
+# Per-process state for candidate workers, set once by `_init_worker` so
+# the prepared inputs are pickled once per worker rather than per task.
+_WORKER_STATE: Dict[str, object] = {}
+
+
+def _init_worker(prepared: _PreparedBacktest, bt_config: BacktestConfig) -> None:
+    _WORKER_STATE["prepared"] = prepared
+    _WORKER_STATE["bt_config"] = bt_config
+
+
+def _score_weights_worker(weights: Dict[str, float]) -> float:
+    sharpe, _eq = _score_weights(
+        _WORKER_STATE["prepared"], weights, _WORKER_STATE["bt_config"]
+    )
+    return sharpe
+
+
 def calibrate_phase1(
     df: pd.DataFrame,
     candidate_weights: Iterable[Dict[str, float]],
@@ -157,7 +418,8 @@ def calibrate_phase1(
         Iterable of dictionaries mapping factor names (e.g. 'RS_score') to
         weights that sum (roughly) to 1.
     bt_config:
-        BacktestConfig.
+        BacktestConfig. `n_jobs` > 1 (or None for all cores) scores the
+        candidates in a process pool.
 
     Returns
     -------
@@ -166,11 +428,25 @@ def calibrate_phase1(
     if bt_config is None:
         bt_config = BacktestConfig()
 
+    candidates = list(candidate_weights)
+    prepared = _prepare_backtest(df, bt_config)
+
+    n_jobs = bt_config.n_jobs or os.cpu_count() or 1
+    n_jobs = min(n_jobs, len(candidates))
+    if n_jobs > 1:
+        with ProcessPoolExecutor(
+            max_workers=n_jobs,
+            initializer=_init_worker,
+            initargs=(prepared, bt_config),
+        ) as ex:
+            sharpes = list(ex.map(_score_weights_worker, candidates))
+    else:
+        sharpes = [_score_weights(prepared, w, bt_config)[0] for w in candidates]
+
     best_sharpe = -np.inf
     best_weights: Dict[str, float] = {}
 
-    for w in candidate_weights:
-        sharpe, _eq = backtest_weights(df, w, bt_config)
+    for w, sharpe in zip(candidates, sharpes):
         if sharpe > best_sharpe:
             best_sharpe = sharpe
             best_weights = dict(w)
@@ -4,7 +4,8 @@ Data snapshot, checksum, and schema validation utilities.
 Implements:
 - Saving raw data snapshots to Parquet with timestamped filenames.
 - Calculating file checksums.
-- Simple schema/type validation and schema-diff detection.
+- Simple schema/type validation and schema-diff detection, both on
+  loaded DataFrames and on the Parquet footer before loading.
 """
 
 from __future__ import annotations
@@ -12,11 +13,21 @@ from __future__ import annotations
 import hashlib
 import json
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+_CHECKSUM_CHUNK_SIZE = 1 << 20
+_SNAPSHOT_ZSTD_LEVEL = 3
+_SNAPSHOT_ROW_GROUP_SIZE = 128_000
+
+# UTC timestamp embedded in snapshot filenames.
+FILENAME_TS = "%Y%m%d_%H%M%S"
 
 
 @dataclass
@@ -44,29 +55,142 @@ def save_raw_snapshot(
 ) -> Path:
     """
     Save a raw Parquet snapshot with a timestamped filename and return the path.
+
+    Written as a single ZSTD-compressed file (pyarrow's default
+    dictionary encoding stays on for every column), so
+    `calculate_checksum` can hash the returned path directly.
     """
     output_dir = Path(output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    ts = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+    ts = datetime.now(timezone.utc).strftime(FILENAME_TS)
     filename = f"{label}_snapshot_{ts}.parquet"
     path = output_dir / filename
 
-    df.to_parquet(path)
+    df.to_parquet(
+        path,
+        engine="pyarrow",
+        compression="zstd",
+        compression_level=_SNAPSHOT_ZSTD_LEVEL,
+        row_group_size=_SNAPSHOT_ROW_GROUP_SIZE,
+    )
     return path
 
 
 def calculate_checksum(path: str | Path, algo: str = "sha256") -> str:
     """
     Calculate a checksum of a file using the selected algorithm.
+
+    On Python 3.11+ the read/update loop runs inside `hashlib.file_digest`;
+    OpenSSL's SHA-256 then uses the CPU's SHA extensions where available.
+    Older interpreters fall back to reading 1 MiB chunks.
     """
-    h = hashlib.new(algo)
     with open(path, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, algo).hexdigest()
+
+        h = hashlib.new(algo)
+        for chunk in iter(lambda: f.read(_CHECKSUM_CHUNK_SIZE), b""):
             h.update(chunk)
     return h.hexdigest()
 
 
+def load_raw_snapshot(
+    path: str | Path,
+    schema: SchemaDefinition | None = None,
+) -> pd.DataFrame:
+    """
+    Load a Parquet snapshot, optionally validating its schema first.
+
+    The schema check reads only the Parquet footer, so a mismatched
+    snapshot is rejected before any data is deserialized.
+    """
+    if schema is not None:
+        validate_parquet_schema(path, schema)
+    return pd.read_parquet(path)
+
+
+def _nullable_dtypes(arrow_schema: pa.Schema) -> Dict[str, str]:
+    """
+    Column -> pandas nullable dtype (e.g. 'Int64', 'boolean') recorded in
+    the file's pandas metadata.
+
+    Arrow stores these as plain int64/bool/double columns; only the
+    metadata says they load back as extension dtypes.
+    """
+    metadata = arrow_schema.pandas_metadata or {}
+    nullable = {}
+    for col in metadata.get("columns", []):
+        name = col.get("field_name")
+        if name not in arrow_schema.names:
+            continue
+        arrow_type = arrow_schema.field(name).type
+        if not (
+            pa.types.is_integer(arrow_type)
+            or pa.types.is_floating(arrow_type)
+            or pa.types.is_boolean(arrow_type)
+        ):
+            continue
+        try:
+            dtype = pd.api.types.pandas_dtype(col.get("numpy_type"))
+        except TypeError:
+            continue
+        if isinstance(dtype, pd.api.extensions.ExtensionDtype):
+            nullable[name] = str(dtype)
+    return nullable
+
+
+def _arrow_matches_dtype(arrow_type: pa.DataType, expected_dtype: str) -> bool:
+    """Whether an Arrow column type loads as the expected pandas dtype."""
+    if pa.types.is_string(arrow_type) or pa.types.is_large_string(arrow_type):
+        return expected_dtype in ("object", "string", "str")
+    if pa.types.is_dictionary(arrow_type):
+        return expected_dtype == "category"
+    if pa.types.is_date(arrow_type):
+        # date32/date64 load back as `datetime.date` objects.
+        return expected_dtype == "object"
+    try:
+        pandas_dtype = arrow_type.to_pandas_dtype()
+    except NotImplementedError:
+        return False
+    if not isinstance(pandas_dtype, pd.api.extensions.ExtensionDtype):
+        pandas_dtype = np.dtype(pandas_dtype)
+    return str(pandas_dtype) == expected_dtype
+
+
+def validate_parquet_schema(
+    path: str | Path,
+    schema: SchemaDefinition,
+) -> None:
+    """
+    Validate a Parquet file's Arrow schema against the expected schema.
+
+    Cheap pre-load counterpart of `validate_schema`: only the file footer
+    is read. Raises ValueError when a mismatch is detected.
+    """
+    arrow_schema = pq.read_schema(path)
+    names = set(arrow_schema.names)
+
+    missing_cols = set(schema.dtypes) - names
+    if missing_cols:
+        raise ValueError(f"Missing columns: {sorted(missing_cols)}")
+
+    nullable = _nullable_dtypes(arrow_schema)
+    for col, expected_dtype in schema.dtypes.items():
+        if col in nullable:
+            if nullable[col] != expected_dtype:
+                raise ValueError(
+                    f"Column {col!r} has dtype {nullable[col]}, "
+                    f"expected {expected_dtype}"
+                )
+            continue
+        arrow_type = arrow_schema.field(col).type
+        if not _arrow_matches_dtype(arrow_type, expected_dtype):
+            raise ValueError(
+                f"Column {col!r} has Arrow type {arrow_type}, expected {expected_dtype}"
+            )
+
+
 def validate_schema(
     df: pd.DataFrame,
     schema: SchemaDefinition,
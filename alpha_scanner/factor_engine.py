@@ -16,7 +16,12 @@ from typing import Optional
 import pandas as pd
 
 from . import factors
-from .factors.utils import ensure_multiindex, rank_normalize
+from .factors.utils import (
+    FactorCache,
+    ensure_multiindex,
+    factor_dtype,
+    rank_normalize,
+)
 
 
 @dataclass
@@ -47,32 +52,46 @@ def compute_factor_matrix(
         Optional benchmark close series (e.g. SPY) for RS.
     config:
         FactorEngineConfig.
+
+    OHLCV columns are downcast to float32 (unless a value would overflow
+    it) and the factor scores are returned as float32; float32 is only
+    the storage dtype, every rolling sum/mean/std accumulates in float64
+    and is cast back. A single FactorCache (dense panels when the
+    universe allows) is shared by all factors for the duration of the
+    call, so common reductions (SMA 20, ATR 20, ROC 20, ...) are
+    computed once.
     """
     if config is None:
         config = FactorEngineConfig()
 
     df = ensure_multiindex(df)
 
+    dtype = factor_dtype(df)
+    cache = FactorCache(df, dtype=dtype)
+    df = cache.df
+
     raw_factors = {}
 
     if config.use_rs:
-        rs_raw = factors.compute_rs_score(df, benchmark_prices=benchmark_prices)
+        rs_raw = factors.compute_rs_score(
+            df, benchmark_prices=benchmark_prices, cache=cache
+        )
         raw_factors["RS_raw"] = rs_raw
 
     if config.use_trend:
-        trend_raw = factors.compute_trend_score(df)
+        trend_raw = factors.compute_trend_score(df, cache=cache)
         raw_factors["Trend_raw"] = trend_raw
 
     if config.use_squeeze:
-        squeeze_raw = factors.compute_squeeze_score(df)
+        squeeze_raw = factors.compute_squeeze_score(df, cache=cache)
         raw_factors["Squeeze_raw"] = squeeze_raw
 
     if config.use_momentum:
-        momentum_raw = factors.compute_momentum_score(df)
+        momentum_raw = factors.compute_momentum_score(df, cache=cache)
         raw_factors["Momentum_raw"] = momentum_raw
 
     if config.use_volume:
-        volume_raw = factors.compute_volume_score(df)
+        volume_raw = factors.compute_volume_score(df, cache=cache)
         raw_factors["Volume_raw"] = volume_raw
 
     raw_df = pd.DataFrame(raw_factors)
@@ -80,7 +99,9 @@ def compute_factor_matrix(
 
     scores = {}
     for col in raw_df.columns:
-        scores[col.replace("_raw", "_score")] = rank_normalize(raw_df[col])
+        scores[col.replace("_raw", "_score")] = rank_normalize(
+            raw_df[col], dtype=dtype
+        )
 
     scores_df = pd.DataFrame(scores)
     scores_df.index = raw_df.index
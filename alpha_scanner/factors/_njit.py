@@ -0,0 +1,24 @@
+"""
+Optional Numba JIT decorator.
+
+When numba is installed, `njit` is numba's own decorator. Otherwise it
+degrades to a no-op so the kernels still run as plain Python.
+"""
+
+from __future__ import annotations
+
+try:
+    from numba import njit  # noqa: F401
+
+    HAS_NUMBA = True
+except ImportError:  # pragma: no cover - optional dependency
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):  # type: ignore[no-redef]
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
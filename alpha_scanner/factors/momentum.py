@@ -11,14 +11,17 @@ Aggregates:
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Optional
 
 import numpy as np
 import pandas as pd
 
+from ._njit import HAS_NUMBA, njit
 from .utils import (
+    FactorCache,
+    GroupOrder,
     ensure_multiindex,
-    rate_of_change,
-    rolling_apply_grouped,
+    ticker_group_order,
     validate_required_columns,
 )
 
@@ -43,44 +46,172 @@ def _ema(series: pd.Series, span: int) -> pd.Series:
     (date, ticker) and single-index Series.
     """
     if isinstance(series.index, pd.MultiIndex):
+        # groupby-aware ewm runs the recurrence for every ticker in one
+        # compiled pass instead of a Python apply per group.
+        mean_kwargs = (
+            {"engine": "numba", "engine_kwargs": {"nopython": True}}
+            if HAS_NUMBA
+            else {}
+        )
         return (
             series.groupby(level="ticker")
-            .apply(
-                lambda s: s.droplevel("ticker").ewm(span=span, adjust=False).mean()
-            )
+            .ewm(span=span, adjust=False)
+            .mean(**mean_kwargs)
             .reset_index(level=0, drop=True)
         )
     # Fallback: treat as a single time series
     return series.ewm(span=span, adjust=False).mean()
 
 
-def _rsi(close: pd.Series, period: int) -> pd.Series:
-    diff = close.groupby(level="ticker").diff()
-    up = diff.clip(lower=0.0)
-    down = -diff.clip(upper=0.0)
+@njit(cache=True)
+def _rsi_loop(
+    values: np.ndarray,
+    bounds: np.ndarray,
+    period: int,
+    out: np.ndarray,
+) -> None:
+    """
+    Rolling-mean RSI over ticker-contiguous `values`.
 
-    roll_up = rolling_apply_grouped(up, period, lambda x: x.mean())
-    roll_down = rolling_apply_grouped(down, period, lambda x: x.mean())
+    Keeps running up/down sums per ticker, so each step is O(1). A window
+    is only emitted once it holds `period` valid diffs, matching
+    `rolling(period, min_periods=period).mean()`.
+    """
+    for g in range(len(bounds) - 1):
+        start = bounds[g]
+        end = bounds[g + 1]
+        up_sum = 0.0
+        down_sum = 0.0
+        n_valid = 0
+        n_down = 0  # non-zero downs in window, so a flat window is exactly 0
+        for i in range(start, end):
+            if i > start:
+                d = values[i] - values[i - 1]
+                if not np.isnan(d):
+                    n_valid += 1
+                    if d > 0.0:
+                        up_sum += d
+                    elif d < 0.0:
+                        down_sum -= d
+                        n_down += 1
+            j = i - period  # diff leaving the window
+            if j > start:
+                d_old = values[j] - values[j - 1]
+                if not np.isnan(d_old):
+                    n_valid -= 1
+                    if d_old > 0.0:
+                        up_sum -= d_old
+                    elif d_old < 0.0:
+                        down_sum += d_old
+                        n_down -= 1
+
+            if n_valid < period or n_down == 0:
+                out[i] = np.nan
+            else:
+                rs = up_sum / down_sum
+                out[i] = 100.0 - 100.0 / (1.0 + rs)
+
+
+@njit(cache=True)
+def _stoch_loop(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    bounds: np.ndarray,
+    period: int,
+    out_k: np.ndarray,
+) -> None:
+    """
+    Stochastic %K over ticker-contiguous arrays.
 
-    rs = roll_up / roll_down.replace(0, np.nan)
-    rsi = 100.0 - (100.0 / (1.0 + rs))
-    return rsi
+    Rolling max/min use monotonic deques of indices, so the whole pass
+    is O(N) regardless of `period`.
+    """
+    n = len(close)
+    max_q = np.empty(n, dtype=np.int64)
+    min_q = np.empty(n, dtype=np.int64)
+    for g in range(len(bounds) - 1):
+        start = bounds[g]
+        end = bounds[g + 1]
+        max_head = 0
+        max_tail = 0
+        min_head = 0
+        min_tail = 0
+        n_nan = 0
+        for i in range(start, end):
+            h = high[i]
+            lo = low[i]
+            if np.isnan(h) or np.isnan(lo):
+                n_nan += 1
+            else:
+                while max_tail > max_head and high[max_q[max_tail - 1]] <= h:
+                    max_tail -= 1
+                max_q[max_tail] = i
+                max_tail += 1
+                while min_tail > min_head and low[min_q[min_tail - 1]] >= lo:
+                    min_tail -= 1
+                min_q[min_tail] = i
+                min_tail += 1
+
+            j = i - period  # row leaving the window
+            if j >= start:
+                if np.isnan(high[j]) or np.isnan(low[j]):
+                    n_nan -= 1
+                if max_tail > max_head and max_q[max_head] == j:
+                    max_head += 1
+                if min_tail > min_head and min_q[min_head] == j:
+                    min_head += 1
+
+            if i - start + 1 < period or n_nan > 0:
+                out_k[i] = np.nan
+                continue
+            rolling_high = high[max_q[max_head]]
+            rolling_low = low[min_q[min_head]]
+            span = rolling_high - rolling_low
+            if span == 0.0:
+                out_k[i] = np.nan
+            else:
+                out_k[i] = (close[i] - rolling_low) / span
+
+
+def _rsi(
+    close: pd.Series,
+    period: int,
+    groups: Optional[GroupOrder] = None,
+) -> pd.Series:
+    order, bounds = groups if groups is not None else ticker_group_order(close.index)
+    values = close.to_numpy(dtype=np.float64)[order]
 
+    out = np.empty_like(values)
+    _rsi_loop(values, bounds, period, out)
 
-def _stochastic_k(df: pd.DataFrame, period: int) -> pd.Series:
-    high = df["high"]
-    low = df["low"]
-    close = df["close"]
+    rsi = np.empty_like(out)
+    rsi[order] = out
+    return pd.Series(rsi, index=close.index)
 
-    rolling_high = rolling_apply_grouped(high, period, max)
-    rolling_low = rolling_apply_grouped(low, period, min)
 
-    return (close - rolling_low) / (rolling_high - rolling_low).replace(0, np.nan)
+def _stochastic_k(
+    df: pd.DataFrame,
+    period: int,
+    groups: Optional[GroupOrder] = None,
+) -> pd.Series:
+    order, bounds = groups if groups is not None else ticker_group_order(df.index)
+    high = df["high"].to_numpy(dtype=np.float64)[order]
+    low = df["low"].to_numpy(dtype=np.float64)[order]
+    close = df["close"].to_numpy(dtype=np.float64)[order]
+
+    out = np.empty_like(close)
+    _stoch_loop(high, low, close, bounds, period, out)
+
+    k = np.empty_like(out)
+    k[order] = out
+    return pd.Series(k, index=df.index)
 
 
 def compute_momentum_score(
     df: pd.DataFrame,
     config: MomentumConfig | None = None,
+    cache: Optional[FactorCache] = None,
 ) -> pd.Series:
     """
     Compute Momentum raw factor per (date, ticker).
@@ -92,11 +223,11 @@ def compute_momentum_score(
 
     validate_required_columns(df, ["date", "ticker", "close"])
     df = ensure_multiindex(df)
+    if cache is None:
+        cache = FactorCache(df)
 
-    close = df["close"]
-
-    roc_short = rate_of_change(close, config.roc_short)
-    roc_long = rate_of_change(close, config.roc_long)
+    roc_short = cache.roc("close", config.roc_short)
+    roc_long = cache.roc("close", config.roc_long)
 
     momentum_raw = 0.6 * roc_short.fillna(0.0) + 0.4 * roc_long.fillna(0.0)
     momentum_raw.name = "Momentum_raw"
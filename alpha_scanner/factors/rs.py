@@ -14,9 +14,16 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 
-from .utils import ensure_multiindex, rate_of_change, validate_required_columns
+from .utils import (
+    FactorCache,
+    Panels,
+    ensure_multiindex,
+    rate_of_change,
+    validate_required_columns,
+)
 
 
 @dataclass
@@ -29,16 +36,43 @@ class RSConfig:
     very_long_window: int = 252  # ~12M
 
 
+def _align_benchmark(benchmark: pd.Series, index: pd.MultiIndex) -> pd.Series:
+    """
+    Broadcast a date-indexed benchmark onto a (date, ticker) index.
+
+    Dates missing from the benchmark take its last earlier value (ffill);
+    dates before its first observation are NaN. Binary search runs once
+    per distinct date and is then gathered through the date codes, so no
+    per-row hash lookup is needed.
+    """
+    if not benchmark.index.is_monotonic_increasing:
+        benchmark = benchmark.sort_index()
+
+    level = index.names.index("date")
+    bench_dates = pd.to_datetime(benchmark.index).to_numpy()
+    target_dates = pd.to_datetime(index.levels[level]).to_numpy()
+
+    pos = np.searchsorted(bench_dates, target_dates, side="right") - 1
+    values = benchmark.to_numpy(dtype=np.float64)
+    per_date = np.full(len(target_dates), np.nan)
+    found = pos >= 0
+    per_date[found] = values[pos[found]]
+
+    return pd.Series(per_date[index.codes[level]], index=index)
+
+
 def _compute_rs_vs_benchmark(
-    prices: pd.Series,
+    roc_asset: pd.Series,
     benchmark: pd.Series,
     window: int,
+    panels: Optional[Panels] = None,
 ) -> pd.Series:
     """
     Compute relative strength vs benchmark as excess ROC over `window`.
+
+    `roc_asset` is the asset's own ROC over the same `window`.
     """
-    roc_asset = rate_of_change(prices, window=window)
-    roc_bench = rate_of_change(benchmark, window=window)
+    roc_bench = rate_of_change(benchmark, window=window, panels=panels)
     roc_bench_aligned = roc_bench.reindex(roc_asset.index, method="ffill")
     return roc_asset - roc_bench_aligned
 
@@ -47,6 +81,7 @@ def compute_rs_score(
     df: pd.DataFrame,
     benchmark_prices: Optional[pd.Series] = None,
     config: Optional[RSConfig] = None,
+    cache: Optional[FactorCache] = None,
 ) -> pd.Series:
     """
     Compute RS raw factor per (date, ticker).
@@ -60,31 +95,39 @@ def compute_rs_score(
         If not provided, RS is computed purely from the asset's own momentum.
     config:
         RSConfig with horizon windows.
+    cache:
+        Optional FactorCache shared across factors for the same `df`.
     """
     if config is None:
         config = RSConfig()
 
     validate_required_columns(df, ["date", "ticker", "close"])
     df = ensure_multiindex(df)
+    if cache is None:
+        cache = FactorCache(df)
+    panels = cache.panels
 
     close = df["close"]
 
-    if benchmark_prices is None:
-        rs_short = rate_of_change(close, config.short_window)
-        rs_mid = rate_of_change(close, config.mid_window)
-        rs_long = rate_of_change(close, config.long_window)
-        rs_vlong = rate_of_change(close, config.very_long_window)
-    else:
-        bench_multi = benchmark_prices.reindex(
-            close.index.get_level_values("date")
-        )
-        bench_multi.index = close.index
+    rs_short = cache.roc("close", config.short_window)
+    rs_mid = cache.roc("close", config.mid_window)
+    rs_long = cache.roc("close", config.long_window)
+    rs_vlong = cache.roc("close", config.very_long_window)
+
+    if benchmark_prices is not None:
+        bench_multi = _align_benchmark(benchmark_prices, close.index)
 
-        rs_short = _compute_rs_vs_benchmark(close, bench_multi, config.short_window)
-        rs_mid = _compute_rs_vs_benchmark(close, bench_multi, config.mid_window)
-        rs_long = _compute_rs_vs_benchmark(close, bench_multi, config.long_window)
+        rs_short = _compute_rs_vs_benchmark(
+            rs_short, bench_multi, config.short_window, panels
+        )
+        rs_mid = _compute_rs_vs_benchmark(
+            rs_mid, bench_multi, config.mid_window, panels
+        )
+        rs_long = _compute_rs_vs_benchmark(
+            rs_long, bench_multi, config.long_window, panels
+        )
         rs_vlong = _compute_rs_vs_benchmark(
-            close, bench_multi, config.very_long_window
+            rs_vlong, bench_multi, config.very_long_window, panels
         )
 
     rs_raw = (
@@ -10,14 +10,14 @@ Captures volatility contraction/expansion patterns via:
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Optional
 
 import numpy as np
 import pandas as pd
 
 from .utils import (
-    atr,
+    FactorCache,
     ensure_multiindex,
-    simple_moving_average,
     validate_required_columns,
 )
 
@@ -35,44 +35,44 @@ class SqueezeConfig:
 def compute_squeeze_score(
     df: pd.DataFrame,
     config: SqueezeConfig | None = None,
+    cache: Optional[FactorCache] = None,
 ) -> pd.Series:
     """
     Compute Squeeze raw factor per (date, ticker).
+
+    With the default config the BB/KC mid line and the KC/short ATR are
+    the same reductions and are computed once.
     """
     if config is None:
         config = SqueezeConfig()
 
     validate_required_columns(df, ["date", "ticker", "high", "low", "close"])
     df = ensure_multiindex(df)
+    if cache is None:
+        cache = FactorCache(df)
 
-    close = df["close"]
     high = df["high"]
     low = df["low"]
 
     # Bollinger Bands
-    mid_bb = simple_moving_average(close, config.bb_window)
-    rolling_std = (
-        close.groupby(level="ticker")
-        .rolling(window=config.bb_window, min_periods=config.bb_window)
-        .std()
-        .reset_index(level=0, drop=True)
-    )
-    upper_bb = mid_bb + config.bb_std * rolling_std
-    lower_bb = mid_bb - config.bb_std * rolling_std
+    mid_bb = cache.sma("close", config.bb_window)
+    std_bb = cache.std("close", config.bb_window)
+    upper_bb = mid_bb + config.bb_std * std_bb
+    lower_bb = mid_bb - config.bb_std * std_bb
     bb_width = (upper_bb - lower_bb) / mid_bb.replace(0, np.nan)
 
     # Keltner Channels (using ATR)
-    mid_kc = simple_moving_average(close, config.kc_window)
-    atr_series = atr(df, window=config.kc_window)
+    mid_kc = cache.sma("close", config.kc_window)
+    atr_series = cache.atr(config.kc_window)
     upper_kc = mid_kc + config.kc_mult * atr_series
     lower_kc = mid_kc - config.kc_mult * atr_series
     kc_width = (upper_kc - lower_kc) / mid_kc.replace(0, np.nan)
 
-    squeeze_flag = (bb_width < kc_width).astype(float)
+    squeeze_flag = bb_width.lt(kc_width).astype(float)
 
     # Volatility ratio (short vs long)
-    atr_short = atr(df, window=config.atr_short)
-    atr_long = atr(df, window=config.atr_long)
+    atr_short = cache.atr(config.atr_short)
+    atr_long = cache.atr(config.atr_long)
     vol_ratio = atr_short / atr_long.replace(0, np.nan)
 
     # Range/ATR proxy
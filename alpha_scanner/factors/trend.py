@@ -11,13 +11,15 @@ Aggregates several sub-elements into a single raw Trend factor:
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Optional
 
 import numpy as np
 import pandas as pd
 
 from .utils import (
+    FactorCache,
     ensure_multiindex,
-    simple_moving_average,
+    shift_grouped,
     validate_required_columns,
 )
 
@@ -30,9 +32,18 @@ class TrendConfig:
     slope_window: int = 20
 
 
+def _zero_to_nan(x: np.ndarray) -> np.ndarray:
+    return np.where(x == 0, np.nan, x)
+
+
+def _nan_to_zero(x: np.ndarray) -> np.ndarray:
+    return np.where(np.isnan(x), 0.0, x)
+
+
 def compute_trend_score(
     df: pd.DataFrame,
     config: TrendConfig | None = None,
+    cache: Optional[FactorCache] = None,
 ) -> pd.Series:
     """
     Compute Trend raw factor per (date, ticker).
@@ -41,43 +52,59 @@ def compute_trend_score(
     ----------
     df:
         OHLCV data with at least ['date', 'ticker', 'close'].
+    cache:
+        Optional FactorCache shared across factors for the same `df`.
     """
     if config is None:
         config = TrendConfig()
 
     validate_required_columns(df, ["date", "ticker", "close"])
     df = ensure_multiindex(df)
+    if cache is None:
+        cache = FactorCache(df)
+    panels = cache.panels
 
     close = df["close"]
 
-    sma_short = simple_moving_average(close, config.sma_short)
-    sma_med = simple_moving_average(close, config.sma_med)
-    sma_long = simple_moving_average(close, config.sma_long)
+    sma_short = cache.sma("close", config.sma_short)
+    sma_med = cache.sma("close", config.sma_med)
+    sma_long = cache.sma("close", config.sma_long)
 
-    # Golden / Death cross state encoded as {-1, 0, +1}
-    cross_state = np.sign(sma_med - sma_long)
+    # Slopes (difference over window)
+    groups = cache.groups
+    sma_med_shifted = shift_grouped(
+        sma_med, config.slope_window, panels=panels, groups=groups
+    )
+    sma_long_shifted = shift_grouped(
+        sma_long, config.slope_window, panels=panels, groups=groups
+    )
 
-    # Distance from long-term trend
-    dist_long = (close - sma_long) / sma_long.replace(0, np.nan)
+    # Every input above is row-aligned with `close`, so the aggregation runs
+    # on raw arrays and skips pandas index alignment.
+    close_v = close.to_numpy()
+    sma_short_v = sma_short.to_numpy()
+    sma_med_v = sma_med.to_numpy()
+    sma_long_v = sma_long.to_numpy()
+    slope_div = max(config.slope_window, 1)
 
-    # Slopes (difference over window)
-    sma_med_shifted = sma_med.groupby(level="ticker").shift(config.slope_window)
-    slope_med = (sma_med - sma_med_shifted) / max(config.slope_window, 1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Golden / Death cross state encoded as {-1, 0, +1}
+        cross_state = np.sign(sma_med_v - sma_long_v)
+
+        # Distance from long-term trend
+        dist_long = (close_v - sma_long_v) / _zero_to_nan(sma_long_v)
 
-    sma_long_shifted = sma_long.groupby(level="ticker").shift(config.slope_window)
-    slope_long = (sma_long - sma_long_shifted) / max(config.slope_window, 1)
+        slope_med = (sma_med_v - sma_med_shifted.to_numpy()) / slope_div
+        slope_long = (sma_long_v - sma_long_shifted.to_numpy()) / slope_div
 
-    # Price position vs short SMA (captures short-term trend alignment)
-    pos_short = (close - sma_short) / sma_short.replace(0, np.nan)
+        # Price position vs short SMA (captures short-term trend alignment)
+        pos_short = (close_v - sma_short_v) / _zero_to_nan(sma_short_v)
 
     trend_raw = (
-        0.35 * cross_state.fillna(0.0)
-        + 0.25 * dist_long.fillna(0.0)
-        + 0.2 * slope_med.fillna(0.0)
-        + 0.1 * slope_long.fillna(0.0)
-        + 0.1 * pos_short.fillna(0.0)
+        0.35 * _nan_to_zero(cross_state)
+        + 0.25 * _nan_to_zero(dist_long)
+        + 0.2 * _nan_to_zero(slope_med)
+        + 0.1 * _nan_to_zero(slope_long)
+        + 0.1 * _nan_to_zero(pos_short)
     )
-    trend_raw.name = "Trend_raw"
-    return trend_raw
-
-
+    return pd.Series(trend_raw, index=close.index, name="Trend_raw")
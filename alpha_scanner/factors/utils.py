@@ -4,10 +4,33 @@ Shared technical-analysis utilities used across factor modules.
 
 from __future__ import annotations
 
-from typing import Iterable, Callable
+from dataclasses import dataclass
+from typing import Callable, Dict, Hashable, Iterable, Optional
 
 import numpy as np
 import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+from ._njit import HAS_NUMBA, njit
+
+try:
+    import bottleneck as bn
+except ImportError:  # pragma: no cover - optional dependency
+    bn = None
+
+OHLCV_PANEL_COLUMNS = ("close", "high", "low", "volume")
+
+# `(order, bounds)` from `ticker_group_order`.
+GroupOrder = tuple[np.ndarray, np.ndarray]
+
+
+_CANONICAL_FLAG = "_alpha_canonical"
+
+
+def _mark_canonical(df: pd.DataFrame) -> pd.DataFrame:
+    """Flag a frame as already (date, ticker)-indexed and sorted."""
+    df.attrs[_CANONICAL_FLAG] = True
+    return df
 
 
 def ensure_multiindex(df: pd.DataFrame) -> pd.DataFrame:
@@ -15,7 +38,19 @@ def ensure_multiindex(df: pd.DataFrame) -> pd.DataFrame:
     Ensure the DataFrame is indexed by ['date', 'ticker'] in that order.
 
     Expected columns: at least ['date', 'ticker'].
+
+    Frames produced here are flagged in `df.attrs`, so the repeated calls
+    made by every factor return them as-is instead of re-sorting. The
+    index is re-checked too, since pandas propagates attrs to derived
+    frames that may no longer be sorted.
     """
+    if (
+        df.attrs.get(_CANONICAL_FLAG)
+        and list(df.index.names) == ["date", "ticker"]
+        and df.index.is_monotonic_increasing
+    ):
+        return df
+
     if isinstance(df.index, pd.MultiIndex):
         # If index already includes date/ticker, just ensure order
         names = list(df.index.names)
@@ -25,10 +60,10 @@ def ensure_multiindex(df: pd.DataFrame) -> pd.DataFrame:
                 df = df.reorder_levels(["date", "ticker"]).sort_index()
             else:
                 df = df.sort_index()
-            return df
+            return _mark_canonical(df)
 
     if {"date", "ticker"}.issubset(df.columns):
-        return df.set_index(["date", "ticker"]).sort_index()
+        return _mark_canonical(df.set_index(["date", "ticker"]).sort_index())
 
     raise ValueError(
         "DataFrame must have a MultiIndex (date, ticker) or columns ['date', 'ticker']"
@@ -43,92 +78,533 @@ def validate_required_columns(df: pd.DataFrame, cols: Iterable[str]) -> None:
         raise ValueError(f"Missing required columns: {sorted(missing)}")
 
 
-def simple_moving_average(series: pd.Series, window: int) -> pd.Series:
-    """Simple moving average along the time axis within each ticker."""
-    return (
-        series.groupby(level="ticker")
-        .rolling(window=window, min_periods=window)
-        .mean()
-        .reset_index(level=0, drop=True)
+@dataclass
+class Panels:
+    """
+    Dense (date x ticker) layout of a canonical OHLCV frame.
+
+    Only built when every ticker has a row on every date. In that case
+    the (date, ticker)-sorted long index is exactly the row-major order
+    of a (D, T) array, so any Series on `index` reshapes to a panel
+    without copying and a rolling window down axis 0 is a rolling window
+    within each ticker.
+    """
+
+    dates: pd.Index
+    tickers: pd.Index
+    index: pd.MultiIndex
+    close: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    volume: np.ndarray
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return len(self.dates), len(self.tickers)
+
+    def view(self, series: pd.Series) -> np.ndarray:
+        """Return a (D, T) view of a Series aligned to `index`."""
+        if len(series) != len(self.index):
+            raise ValueError("Series is not aligned to the panel index")
+        return series.to_numpy().reshape(self.shape)
+
+    def to_series(self, arr: np.ndarray, name: Optional[str] = None) -> pd.Series:
+        """Flatten a (D, T) array back onto the long (date, ticker) index."""
+        return pd.Series(arr.reshape(-1), index=self.index, name=name)
+
+    def to_frame(self) -> pd.DataFrame:
+        """Long OHLCV frame backed by the panel dtype."""
+        df = pd.DataFrame(
+            {col: getattr(self, col).reshape(-1) for col in OHLCV_PANEL_COLUMNS},
+            index=self.index,
+        )
+        return _mark_canonical(df)
+
+
+def factor_dtype(df: pd.DataFrame) -> np.dtype:
+    """
+    Working dtype for factor computation on `df`.
+
+    Factor outputs are ranks, ratios and signs, so float32 is plenty and
+    halves the memory traffic of every rolling pass. Falls back to
+    float64 if any finite OHLCV value would overflow float32.
+    """
+    for col in OHLCV_PANEL_COLUMNS:
+        if col not in df.columns:
+            continue
+        values = df[col].to_numpy(dtype=np.float64)
+        with np.errstate(over="ignore"):
+            narrowed = values.astype(np.float32)
+        if (np.isinf(narrowed) & np.isfinite(values)).any():
+            return np.dtype(np.float64)
+    return np.dtype(np.float32)
+
+
+def cast_ohlcv(df: pd.DataFrame, dtype) -> pd.DataFrame:
+    """Cast the OHLCV columns present in a canonical frame to `dtype`."""
+    cols = {col: dtype for col in OHLCV_PANEL_COLUMNS if col in df.columns}
+    return _mark_canonical(df.astype(cols))
+
+
+def build_panels(df: pd.DataFrame, dtype=np.float32) -> Optional[Panels]:
+    """
+    Build `Panels` from a canonical OHLCV frame, or None if it is ragged.
+
+    `df` must come from `ensure_multiindex`. Missing OHLCV columns or any
+    (date, ticker) hole fall back to the long-format code paths.
+    """
+    if not set(OHLCV_PANEL_COLUMNS).issubset(df.columns):
+        return None
+
+    index = df.index
+    dates = index.unique(level="date")
+    tickers = index.unique(level="ticker")
+    if len(index) != len(dates) * len(tickers) or not index.is_unique:
+        return None
+
+    shape = (len(dates), len(tickers))
+    arrays = {
+        col: df[col].to_numpy(dtype=dtype).reshape(shape)
+        for col in OHLCV_PANEL_COLUMNS
+    }
+    return Panels(dates=dates, tickers=tickers, index=index, **arrays)
+
+
+def move_mean(arr: np.ndarray, window: int) -> np.ndarray:
+    """
+    Rolling mean down axis 0; NaN until `window` valid rows are seen.
+
+    Sums accumulate in float64 (bottleneck would otherwise keep its
+    running sums in the input dtype); the result is cast back to the
+    panel dtype.
+    """
+    out_dtype = np.result_type(arr, np.float32)
+    if window > arr.shape[0]:
+        return np.full(arr.shape, np.nan, dtype=out_dtype)
+    if bn is not None:
+        values = arr.astype(np.float64, copy=False)
+        out = bn.move_mean(values, window, min_count=window, axis=0)
+        # The running sum leaves a rounding residue once a window holds
+        # only zeros (e.g. a halted ticker's volume); report those as 0.
+        idle = bn.move_max(np.abs(values), window, min_count=window, axis=0) == 0
+        out[idle] = 0.0
+        return out.astype(out_dtype, copy=False)
+    out = np.full(arr.shape, np.nan, dtype=out_dtype)
+    out[window - 1:] = sliding_window_view(arr, window, axis=0).mean(
+        axis=-1, dtype=np.float64
+    )
+    return out
+
+
+def move_std(arr: np.ndarray, window: int, ddof: int = 1) -> np.ndarray:
+    """
+    Rolling standard deviation down axis 0 (pandas' default ddof=1).
+
+    Accumulates in float64, like `move_mean`.
+    """
+    out_dtype = np.result_type(arr, np.float32)
+    if window > arr.shape[0]:
+        return np.full(arr.shape, np.nan, dtype=out_dtype)
+    if bn is not None:
+        values = arr.astype(np.float64, copy=False)
+        out = bn.move_std(values, window, min_count=window, axis=0, ddof=ddof)
+        return out.astype(out_dtype, copy=False)
+    out = np.full(arr.shape, np.nan, dtype=out_dtype)
+    out[window - 1:] = sliding_window_view(arr, window, axis=0).std(
+        axis=-1, ddof=ddof, dtype=np.float64
+    )
+    return out
+
+
+def shift_rows(arr: np.ndarray, periods: int) -> np.ndarray:
+    """Shift a panel down axis 0 by `periods` rows, NaN-filling the top."""
+    out = np.full(arr.shape, np.nan, dtype=np.result_type(arr, np.float32))
+    if periods < arr.shape[0]:
+        out[periods:] = arr[: arr.shape[0] - periods]
+    return out
+
+
+@njit(cache=True)
+def _grouped_move_mean(
+    values: np.ndarray,
+    bounds: np.ndarray,
+    window: int,
+    out: np.ndarray,
+) -> None:
+    """
+    Rolling mean over ticker-contiguous `values`.
+
+    Running sum per ticker; a window is emitted only once it holds
+    `window` non-NaN values, like `rolling(window, min_periods=window)`.
+    A window of only zeros yields exactly 0, not the sum's rounding
+    residue.
+    """
+    for g in range(len(bounds) - 1):
+        start = bounds[g]
+        end = bounds[g + 1]
+        total = 0.0
+        n_valid = 0
+        n_nonzero = 0
+        for i in range(start, end):
+            v = values[i]
+            if not np.isnan(v):
+                total += v
+                n_valid += 1
+                if v != 0.0:
+                    n_nonzero += 1
+            j = i - window  # row leaving the window
+            if j >= start:
+                v_old = values[j]
+                if not np.isnan(v_old):
+                    total -= v_old
+                    n_valid -= 1
+                    if v_old != 0.0:
+                        n_nonzero -= 1
+            if i - start + 1 < window or n_valid < window:
+                out[i] = np.nan
+            elif n_nonzero == 0:
+                out[i] = 0.0
+            else:
+                out[i] = total / window
+
+
+def _grouped_rolling(
+    series: pd.Series,
+    window: int,
+    reduce: Callable[[object], pd.Series],
+    groups: Optional[GroupOrder] = None,
+) -> pd.Series:
+    """
+    Per-ticker rolling reduction, returned in `series`' own row order.
+
+    groupby().rolling() emits rows ticker by ticker; mapping them back
+    through `ticker_group_order` keeps every helper's output positionally
+    aligned with its input, so callers can work on raw arrays.
+    """
+    rolled = reduce(
+        series.groupby(level="ticker").rolling(window=window, min_periods=window)
     )
+    order, _ = groups if groups is not None else ticker_group_order(series.index)
+    out = np.empty(len(series), dtype=rolled.dtype)
+    out[order] = rolled.to_numpy()
+    return pd.Series(out, index=series.index, name=series.name)
+
 
+def simple_moving_average(
+    series: pd.Series,
+    window: int,
+    panels: Optional[Panels] = None,
+    groups: Optional[GroupOrder] = None,
+) -> pd.Series:
+    """
+    Simple moving average along the time axis within each ticker.
 
-def rate_of_change(series: pd.Series, window: int) -> pd.Series:
+    `groups` optionally reuses a precomputed `ticker_group_order` of
+    `series.index`; with numba installed the long path then runs as a
+    single kernel pass over the ticker-contiguous values.
+    """
+    if panels is not None:
+        return panels.to_series(
+            move_mean(panels.view(series), window), name=series.name
+        )
+    if HAS_NUMBA and isinstance(series.index, pd.MultiIndex):
+        order, bounds = (
+            groups if groups is not None else ticker_group_order(series.index)
+        )
+        values = series.to_numpy(dtype=np.float64)[order]
+        out = np.empty_like(values)
+        _grouped_move_mean(values, bounds, window, out)
+        result = np.empty(
+            len(out), dtype=np.result_type(series.dtype, np.float32)
+        )
+        result[order] = out
+        return pd.Series(result, index=series.index, name=series.name)
+    return _grouped_rolling(series, window, lambda r: r.mean(), groups=groups)
+
+
+def rolling_std(
+    series: pd.Series,
+    window: int,
+    panels: Optional[Panels] = None,
+    ddof: int = 1,
+    groups: Optional[GroupOrder] = None,
+) -> pd.Series:
+    """
+    Rolling standard deviation within each ticker (pandas' default ddof=1).
+
+    Uses the dense panel when given; otherwise, with bottleneck installed,
+    runs `bn.move_std` over each ticker's contiguous slice.
+    """
+    if panels is not None:
+        return panels.to_series(
+            move_std(panels.view(series), window, ddof=ddof), name=series.name
+        )
+    if bn is not None and isinstance(series.index, pd.MultiIndex):
+        order, bounds = (
+            groups if groups is not None else ticker_group_order(series.index)
+        )
+        values = series.to_numpy(dtype=np.float64)[order]
+        out = np.full(len(values), np.nan)
+        for start, end in zip(bounds[:-1], bounds[1:]):
+            if end - start >= window:
+                out[start:end] = bn.move_std(
+                    values[start:end], window, min_count=window, ddof=ddof
+                )
+        result = np.empty_like(out)
+        result[order] = out
+        return pd.Series(result, index=series.index, name=series.name)
+    return _grouped_rolling(
+        series, window, lambda r: r.std(ddof=ddof), groups=groups
+    )
+
+
+def shift_grouped(
+    series: pd.Series,
+    periods: int,
+    panels: Optional[Panels] = None,
+    groups: Optional[GroupOrder] = None,
+) -> pd.Series:
+    """
+    Lag a Series by `periods` rows within each ticker.
+
+    `groups` optionally reuses a precomputed `ticker_group_order` of
+    `series.index`.
+    """
+    if panels is not None:
+        return panels.to_series(
+            shift_rows(panels.view(series), periods), name=series.name
+        )
+    if list(series.index.names) != ["date", "ticker"]:
+        return series.groupby(level="ticker").shift(periods)
+
+    # One shift over the ticker-contiguous array, then blank the first
+    # `periods` rows of every ticker so nothing leaks across boundaries.
+    order, bounds = groups if groups is not None else ticker_group_order(series.index)
+    values = series.to_numpy(dtype=np.result_type(series.dtype, np.float32))[order]
+    shifted = np.full_like(values, np.nan)
+    if periods < len(values):
+        shifted[periods:] = values[: len(values) - periods]
+    starts = bounds[:-1]
+    pos_in_group = np.arange(len(values)) - np.repeat(starts, np.diff(bounds))
+    shifted[pos_in_group < periods] = np.nan
+
+    out = np.empty_like(shifted)
+    out[order] = shifted
+    return pd.Series(out, index=series.index, name=series.name)
+
+
+def rate_of_change(
+    series: pd.Series,
+    window: int,
+    panels: Optional[Panels] = None,
+    groups: Optional[GroupOrder] = None,
+) -> pd.Series:
     """Percentage rate of change over `window` days within each ticker."""
-    prev = series.groupby(level="ticker").shift(window)
+    prev = shift_grouped(series, window, panels=panels, groups=groups)
     return (series / prev - 1.0) * 100.0
 
 
-def atr(df: pd.DataFrame, window: int = 14) -> pd.Series:
+def true_range(
+    df: pd.DataFrame,
+    panels: Optional[Panels] = None,
+    groups: Optional[GroupOrder] = None,
+) -> pd.Series:
     """
-    Average True Range (ATR) per (date, ticker).
+    True Range per (date, ticker).
 
     Expects columns: 'high', 'low', 'close'.
     """
-    df = ensure_multiindex(df.copy())
-
     high = df["high"]
     low = df["low"]
     close = df["close"]
 
-    prev_close = close.groupby(level="ticker").shift(1)
+    prev_close = shift_grouped(close, 1, panels=panels, groups=groups).to_numpy()
 
-    tr = pd.concat(
-        [
-            high - low,
-            (high - prev_close).abs(),
-            (low - prev_close).abs(),
-        ],
-        axis=1,
-    ).max(axis=1)
-
-    atr_series = (
-        tr.groupby(level="ticker")
-        .rolling(window=window, min_periods=window)
-        .mean()
-        .reset_index(level=0, drop=True)
+    high_v = high.to_numpy()
+    low_v = low.to_numpy()
+    # fmax skips NaN like DataFrame.max(axis=1), so a ticker's first row
+    # (no previous close) still gets high - low.
+    tr = np.fmax(
+        np.fmax(high_v - low_v, np.abs(high_v - prev_close)),
+        np.abs(low_v - prev_close),
     )
+    return pd.Series(tr, index=close.index)
+
+
+def atr(
+    df: pd.DataFrame,
+    window: int = 14,
+    panels: Optional[Panels] = None,
+    groups: Optional[GroupOrder] = None,
+) -> pd.Series:
+    """
+    Average True Range (ATR) per (date, ticker).
+
+    Expects columns: 'high', 'low', 'close'.
+    """
+    df = ensure_multiindex(df)
+
+    tr = true_range(df, panels=panels, groups=groups)
+
+    atr_series = simple_moving_average(tr, window, panels=panels, groups=groups)
     atr_series.name = "atr"
     return atr_series
 
 
+class FactorCache:
+    """
+    Memoized rolling primitives over one canonical OHLCV frame.
+
+    Factors share many reductions (SMA 20 of close, ATR 20, ROC 20 of
+    close, ...). Each result is computed once per `(op, column, window)`
+    key and handed back to every factor that asks for it. A cache is tied
+    to a single frame, so create a fresh one per `compute_factor_matrix`
+    call.
+
+    The frame's OHLCV columns are cast to `dtype` and, when every ticker
+    has a row on every date, laid out once as dense `panels` that all
+    reductions run on. Otherwise the per-ticker grouping is derived once
+    (`groups`) and shared by every long-path helper.
+    """
+
+    def __init__(self, df: pd.DataFrame, dtype=np.float64) -> None:
+        df = ensure_multiindex(df)
+        self.panels = build_panels(df, dtype=dtype)
+        self.df = (
+            self.panels.to_frame()
+            if self.panels is not None
+            else cast_ohlcv(df, dtype)
+        )
+        self._store: Dict[Hashable, pd.Series] = {}
+        self._groups: Optional[GroupOrder] = None
+
+    @property
+    def groups(self) -> Optional[GroupOrder]:
+        """`ticker_group_order` of the frame's index; None on the panel path."""
+        if self.panels is not None:
+            return None
+        if self._groups is None:
+            self._groups = ticker_group_order(self.df.index)
+        return self._groups
+
+    def _memo(self, key: Hashable, compute: Callable[[], pd.Series]) -> pd.Series:
+        if key not in self._store:
+            self._store[key] = compute()
+        return self._store[key]
+
+    def sma(self, col: str, window: int) -> pd.Series:
+        return self._memo(
+            ("sma", col, window),
+            lambda: simple_moving_average(
+                self.df[col], window, panels=self.panels, groups=self.groups
+            ),
+        )
+
+    def std(self, col: str, window: int) -> pd.Series:
+        return self._memo(
+            ("std", col, window),
+            lambda: rolling_std(
+                self.df[col], window, panels=self.panels, groups=self.groups
+            ),
+        )
+
+    def shift(self, col: str, periods: int) -> pd.Series:
+        return self._memo(
+            ("shift", col, periods),
+            lambda: shift_grouped(
+                self.df[col], periods, panels=self.panels, groups=self.groups
+            ),
+        )
+
+    def roc(self, col: str, window: int) -> pd.Series:
+        return self._memo(
+            ("roc", col, window),
+            lambda: (self.df[col] / self.shift(col, window) - 1.0) * 100.0,
+        )
+
+    def true_range(self) -> pd.Series:
+        return self._memo(
+            ("true_range", None, None),
+            lambda: true_range(self.df, panels=self.panels, groups=self.groups),
+        )
+
+    def atr(self, window: int) -> pd.Series:
+        def _compute() -> pd.Series:
+            atr_series = simple_moving_average(
+                self.true_range(), window, panels=self.panels, groups=self.groups
+            )
+            atr_series.name = "atr"
+            return atr_series
+
+        return self._memo(("atr", None, window), _compute)
+
+
 def rank_normalize(
     series: pd.Series,
     lower: float = -1.0,
     upper: float = 1.0,
+    dtype=None,
 ) -> pd.Series:
     """
     Cross-sectionally rank-normalize a Series per date to [lower, upper].
 
-    Expects a MultiIndex (date, ticker).
+    Expects a MultiIndex (date, ticker). `dtype` optionally narrows the
+    result (e.g. float32 inside the factor engine).
     """
     if not isinstance(series.index, pd.MultiIndex):
         raise ValueError("Series must use a MultiIndex (date, ticker)")
 
-    def _rank(group: pd.Series) -> pd.Series:
-        n = len(group)
-        if n <= 1:
-            return pd.Series(0.0, index=group.index)
-        ranks = group.rank(method="average")
-        scaled = lower + (ranks - 1.0) * (upper - lower) / (n - 1.0)
-        return scaled
+    by_date = series.groupby(level="date")
+    ranks = by_date.rank(method="average")
+    counts = by_date.transform("size")
 
-    return series.groupby(level="date").transform(_rank)
+    scaled = lower + (ranks - 1.0) * (upper - lower) / (counts - 1.0)
+    # Single-name cross-sections carry no ranking information.
+    scaled = scaled.where(counts > 1, 0.0)
+    if dtype is not None:
+        scaled = scaled.astype(dtype)
+    return scaled
 
 
 def zscore_cross_sectional(series: pd.Series) -> pd.Series:
     """
     Cross-sectional z-score per date.
     """
+    by_date = series.groupby(level="date")
+    mu = by_date.transform("mean")
+    sigma = by_date.transform("std", ddof=0)
+
+    z = (series - mu) / sigma
+    return z.where((sigma != 0) & sigma.notna(), 0.0)
+
+
+def ticker_group_order(index: pd.MultiIndex) -> GroupOrder:
+    """
+    Permutation that makes each ticker contiguous, plus group boundaries.
 
-    def _z(group: pd.Series) -> pd.Series:
-        mu = group.mean()
-        sigma = group.std(ddof=0)
-        if sigma == 0 or np.isnan(sigma):
-            return pd.Series(0.0, index=group.index)
-        return (group - mu) / sigma
+    Expects a (date, ticker) MultiIndex sorted by date, as returned by
+    `ensure_multiindex`. Returns `(order, bounds)` where `values[order]`
+    is grouped by ticker (dates stay in order within a ticker) and the
+    `g`-th group occupies `bounds[g]:bounds[g + 1]` of the reordered array.
 
-    return series.groupby(level="date").transform(_z)
+    Groups come straight from the index's integer ticker codes, so no
+    ticker labels are hashed. Codes are ranked by label first, so groups
+    follow sorted ticker order exactly like `groupby(level="ticker")` even
+    when the level itself is unsorted (e.g. after `DataFrame.stack()`).
+    """
+    level = index.names.index("ticker")
+    codes = np.asarray(index.codes[level])
+    labels = index.levels[level]
+    if not labels.is_monotonic_increasing:
+        rank = np.empty(len(labels), dtype=codes.dtype)
+        rank[labels.argsort()] = np.arange(len(labels), dtype=codes.dtype)
+        codes = rank[codes]
+    order = np.argsort(codes, kind="stable")
+    sorted_codes = codes[order]
+    bounds = np.concatenate(
+        ([0], np.flatnonzero(np.diff(sorted_codes)) + 1, [len(sorted_codes)])
+    ).astype(np.int64)
+    return order, bounds
 
 
 def rolling_apply_grouped(
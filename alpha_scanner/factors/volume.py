@@ -10,14 +10,14 @@ Aggregates:
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Optional
 
 import numpy as np
 import pandas as pd
 
 from .utils import (
+    FactorCache,
     ensure_multiindex,
-    rate_of_change,
-    simple_moving_average,
     validate_required_columns,
 )
 
@@ -32,6 +32,7 @@ class VolumeConfig:
 def compute_volume_score(
     df: pd.DataFrame,
     config: VolumeConfig | None = None,
+    cache: Optional[FactorCache] = None,
 ) -> pd.Series:
     """
     Compute Volume raw factor per (date, ticker).
@@ -41,18 +42,19 @@ def compute_volume_score(
 
     validate_required_columns(df, ["date", "ticker", "close", "volume"])
     df = ensure_multiindex(df)
+    if cache is None:
+        cache = FactorCache(df)
 
-    close = df["close"]
     volume = df["volume"]
 
-    vol_ma_short = simple_moving_average(volume, config.vol_ma_short)
-    vol_ma_long = simple_moving_average(volume, config.vol_ma_long)
+    vol_ma_short = cache.sma("volume", config.vol_ma_short)
+    vol_ma_long = cache.sma("volume", config.vol_ma_long)
 
     vol_ratio_short = volume / vol_ma_short.replace(0, np.nan)
     vol_ratio_long = volume / vol_ma_long.replace(0, np.nan)
 
-    vol_roc = rate_of_change(volume, config.roc_window)
-    price_roc = rate_of_change(close, config.roc_window)
+    vol_roc = cache.roc("volume", config.roc_window)
+    price_roc = cache.roc("close", config.roc_window)
     divergence = price_roc - vol_roc
 
     volume_raw = (
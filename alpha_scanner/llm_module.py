@@ -10,10 +10,27 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import date
-from typing import Dict, Iterable
+from typing import Callable, Dict, Hashable, Iterable, Optional, Sequence
 
+import numpy as np
 import pandas as pd
 
+try:
+    import diskcache
+except ImportError:  # pragma: no cover - optional dependency
+    diskcache = None
+
+_FUNDAMENTAL_COLUMNS = (
+    "fund_quality_score",
+    "fund_valuation_score",
+    "fund_risk_score",
+)
+_SENTIMENT_COLUMNS = (
+    "news_sentiment_short_term",
+    "news_sentiment_medium_term",
+    "controversy_score",
+)
+
 
 @dataclass
 class LLMModuleConfig:
@@ -25,19 +42,86 @@ class LLMModuleConfig:
     - Model names.
     - Prompt templates.
     - Cache locations.
+
+    `prompt_version` is part of every cache key: bump it whenever the
+    prompt templates or model change so stale scores are not reused.
+    `cache_dir` persists the cache across runs (requires `diskcache`).
     """
 
     enabled: bool = False
+    cache_enabled: bool = True
+    cache_dir: Optional[str] = None
+    prompt_version: str = "v0"
+
+
+class LLMCache:
+    """
+    Exact-match cache of LLM score responses.
+
+    Keys are `(kind, ticker, as_of_date, prompt_version)`. Entries live in
+    an in-process dict; with `directory` set they are also written through
+    to a `diskcache.Cache`, so repeated scanner runs over overlapping
+    universes and dates skip the provider entirely.
+    """
+
+    def __init__(self, directory: Optional[str] = None) -> None:
+        self.exact: Dict[Hashable, Dict[str, float]] = {}
+        self._disk = None
+        if directory is not None:
+            if diskcache is None:
+                raise ImportError("cache_dir requires the 'diskcache' package")
+            self._disk = diskcache.Cache(directory)
+
+    def get(self, key: Hashable) -> Optional[Dict[str, float]]:
+        scores = self.exact.get(key)
+        if scores is None and self._disk is not None:
+            scores = self._disk.get(key)
+            if scores is not None:
+                self.exact[key] = scores
+        return scores
+
+    def put(self, key: Hashable, scores: Dict[str, float]) -> None:
+        self.exact[key] = scores
+        if self._disk is not None:
+            self._disk.set(key, scores)
+
+    def clear(self) -> None:
+        self.exact.clear()
+        if self._disk is not None:
+            self._disk.clear()
 
 
 class LLMAlphaModule:
     """
     Thin interface around an external LLM used to derive
     fundamentals and sentiment scores.
+
+    Integrators implement `_fetch_fundamental_scores` and
+    `_fetch_sentiment_scores`; the public getters put an `LLMCache` in
+    front of them so each (ticker, date) is sent to the provider once.
     """
 
     def __init__(self, config: LLMModuleConfig | None = None) -> None:
         self.config = config or LLMModuleConfig()
+        self.cache: Optional[LLMCache] = (
+            LLMCache(self.config.cache_dir) if self.config.cache_enabled else None
+        )
+
+    def _cached(
+        self,
+        kind: str,
+        ticker: str,
+        as_of_date: date,
+        fetch: Callable[[str, date], Dict[str, float]],
+    ) -> Dict[str, float]:
+        if self.cache is None:
+            return fetch(ticker, as_of_date)
+        key = (kind, ticker, as_of_date, self.config.prompt_version)
+        scores = self.cache.get(key)
+        if scores is None:
+            scores = fetch(ticker, as_of_date)
+            self.cache.put(key, scores)
+        return dict(scores)
 
     def get_fundamental_scores(
         self,
@@ -46,6 +130,30 @@ class LLMAlphaModule:
     ) -> Dict[str, float]:
         """
         Return fundamental overlay scores for a single ticker.
+        """
+        return self._cached(
+            "fundamental", ticker, as_of_date, self._fetch_fundamental_scores
+        )
+
+    def get_sentiment_scores(
+        self,
+        ticker: str,
+        as_of_date: date,
+    ) -> Dict[str, float]:
+        """
+        Return sentiment/news scores for a single ticker.
+        """
+        return self._cached(
+            "sentiment", ticker, as_of_date, self._fetch_sentiment_scores
+        )
+
+    def _fetch_fundamental_scores(
+        self,
+        ticker: str,
+        as_of_date: date,
+    ) -> Dict[str, float]:
+        """
+        Query the provider for fundamental scores (uncached).
 
         This is a stub implementation that returns neutral scores.
         """
@@ -55,13 +163,13 @@ class LLMAlphaModule:
             "fund_risk_score": 0.0,
         }
 
-    def get_sentiment_scores(
+    def _fetch_sentiment_scores(
         self,
         ticker: str,
         as_of_date: date,
     ) -> Dict[str, float]:
         """
-        Return sentiment/news scores for a single ticker.
+        Query the provider for sentiment/news scores (uncached).
 
         This is a stub implementation that returns neutral scores.
         """
@@ -79,22 +187,9 @@ class LLMAlphaModule:
         """
         Batch version returning a DataFrame indexed by ticker.
         """
-        rows = []
-        for t in tickers:
-            row = self.get_fundamental_scores(t, as_of_date)
-            row["ticker"] = t
-            rows.append(row)
-        if not rows:
-            return pd.DataFrame(
-                columns=[
-                    "ticker",
-                    "fund_quality_score",
-                    "fund_valuation_score",
-                    "fund_risk_score",
-                ]
-            ).set_index("ticker")
-        df = pd.DataFrame(rows).set_index("ticker")
-        return df
+        return self._scores_batch(
+            self.get_fundamental_scores, _FUNDAMENTAL_COLUMNS, tickers, as_of_date
+        )
 
     def get_sentiment_scores_batch(
         self,
@@ -104,21 +199,38 @@ class LLMAlphaModule:
         """
         Batch version returning a DataFrame indexed by ticker.
         """
-        rows = []
-        for t in tickers:
-            row = self.get_sentiment_scores(t, as_of_date)
-            row["ticker"] = t
-            rows.append(row)
-        if not rows:
-            return pd.DataFrame(
-                columns=[
-                    "ticker",
-                    "news_sentiment_short_term",
-                    "news_sentiment_medium_term",
-                    "controversy_score",
-                ]
-            ).set_index("ticker")
-        df = pd.DataFrame(rows).set_index("ticker")
-        return df
-
+        return self._scores_batch(
+            self.get_sentiment_scores, _SENTIMENT_COLUMNS, tickers, as_of_date
+        )
+
+    @staticmethod
+    def _scores_batch(
+        score_fn: Callable[[str, date], Dict[str, float]],
+        columns: Sequence[str],
+        tickers: Iterable[str],
+        as_of_date: date,
+    ) -> pd.DataFrame:
+        """
+        Fill one preallocated float32 array per score column.
 
+        Columns are the union of every ticker's score keys, in first-seen
+        order, so overrides returning extra keys keep them; a ticker
+        missing a key gets NaN there. `columns` only shapes the empty
+        result.
+        """
+        tickers = list(tickers)
+        n = len(tickers)
+        index = pd.Index(tickers, name="ticker", dtype=object)
+        if n == 0:
+            return pd.DataFrame(
+                {c: np.empty(0, dtype=np.float32) for c in columns}, index=index
+            )
+
+        data: Dict[str, np.ndarray] = {}
+        for i, ticker in enumerate(tickers):
+            for k, v in score_fn(ticker, as_of_date).items():
+                arr = data.get(k)
+                if arr is None:
+                    arr = data[k] = np.full(n, np.nan, dtype=np.float32)
+                arr[i] = v
+        return pd.DataFrame(data, index=index)
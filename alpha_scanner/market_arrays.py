@@ -0,0 +1,88 @@
+"""
+Struct-of-arrays layout of long (date, ticker) market data.
+
+`MarketArrays` keeps prices, volume and an optional volatility proxy as
+flat float64 arrays ordered ticker by ticker, with per-ticker boundaries
+alongside. Grouped kernels (e.g. the fused TCCM kernel) consume the
+fields directly, so repeated cost evaluations over the same market data
+skip regrouping and re-gathering the inputs.
+
+Unlike `factors.utils.Panels`, a dense (date x ticker) grid that only
+exists when every ticker trades on every date, `MarketArrays` handles
+ragged histories.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from .factors.utils import ticker_group_order
+
+
+@dataclass
+class MarketArrays:
+    """
+    Ticker-contiguous (date, ticker) rows as parallel arrays.
+
+    Sorted row `k` is row `order[k]` of `index`; ticker `g` occupies
+    `bounds[g]:bounds[g + 1]`, with its dates in their original
+    (ascending) order.
+    """
+
+    index: pd.MultiIndex
+    order: np.ndarray
+    bounds: np.ndarray
+    price: np.ndarray
+    volume: np.ndarray
+    volatility: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    @classmethod
+    def from_series(
+        cls,
+        prices: pd.Series,
+        volume: pd.Series,
+        volatility: Optional[pd.Series] = None,
+        index: Optional[pd.MultiIndex] = None,
+    ) -> MarketArrays:
+        """
+        Build from Series on one (date, ticker) index.
+
+        `index` selects the rows (default: that of `prices`); every Series
+        not already on it is aligned to it.
+        """
+        if index is None:
+            index = prices.index
+        if not isinstance(index, pd.MultiIndex):
+            raise ValueError("MarketArrays rows need a MultiIndex (date, ticker)")
+        order, bounds = ticker_group_order(index)
+        market = cls(
+            index=index,
+            order=order,
+            bounds=bounds,
+            price=np.empty(0),
+            volume=np.empty(0),
+        )
+        market.price = market.take(prices)
+        market.volume = market.take(volume)
+        if volatility is not None:
+            market.volatility = market.take(volatility)
+        return market
+
+    def take(self, series: pd.Series) -> np.ndarray:
+        """Align `series` to `index` and return it in ticker-contiguous order."""
+        if not (series.index is self.index or series.index.equals(self.index)):
+            series = series.reindex(self.index)
+        return series.to_numpy(dtype=np.float64)[self.order]
+
+    def restore(self, values: np.ndarray) -> np.ndarray:
+        """Scatter ticker-contiguous `values` back to the row order of `index`."""
+        out = np.empty_like(values)
+        out[self.order] = values
+        return out
@@ -10,9 +10,37 @@ from __future__ import annotations
 
 from datetime import date
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Sequence
 
+import numpy as np
 import pandas as pd
+import xlsxwriter
+
+# Candidate columns in sheet order (after the leading Rank column).
+_COL_ORDER = (
+    "ticker",
+    "composite_score",
+    "vol_adj_shares",
+    "est_entry_price",
+    "est_slippage_cost",
+    "capacity_usage",
+    "significance",
+)
+_REQUIRED_COLS = frozenset(_COL_ORDER)
+_RENAME = {
+    "ticker": "Ticker",
+    "composite_score": "Composite Score",
+    "vol_adj_shares": "Vol_Adj_Shares",
+    "est_entry_price": "Est_Entry_Price",
+    "est_slippage_cost": "Est_Slippage_Cost",
+    "capacity_usage": "Capacity_Usage",
+    "significance": "Significance",
+}
+# Cell kind and width per sheet column (Rank first, then `_COL_ORDER`).
+# "auto" leaves the type to xlsxwriter (significance may be a number or a
+# label).
+_COL_TYPES = ("int", "str", "num4", "int", "num4", "num4", "num4", "auto")
+_COL_WIDTHS = (6, 10, 16, 15, 16, 18, 15, 13)
 
 
 def write_scanner_results_excel(
@@ -49,51 +77,94 @@ def write_scanner_results_excel(
     else:
         filepath = output_path
 
-    required_cols = [
-        "ticker",
-        "composite_score",
-        "vol_adj_shares",
-        "est_entry_price",
-        "est_slippage_cost",
-        "capacity_usage",
-        "significance",
-    ]
-    missing = [c for c in required_cols if c not in candidates.columns]
+    missing = _REQUIRED_COLS.difference(candidates.columns)
     if missing:
-        raise ValueError(f"Missing required candidate columns: {missing}")
-
-    df = candidates.copy()
-    df["Rank"] = df["composite_score"].rank(
-        method="first", ascending=False
-    ).astype(int)
-    df = df.sort_values("Rank")
-
-    sheet = df[
-        [
-            "Rank",
-            "ticker",
-            "composite_score",
-            "vol_adj_shares",
-            "est_entry_price",
-            "est_slippage_cost",
-            "capacity_usage",
-            "significance",
-        ]
-    ].rename(
-        columns={
-            "ticker": "Ticker",
-            "composite_score": "Composite Score",
-            "vol_adj_shares": "Vol_Adj_Shares",
-            "est_entry_price": "Est_Entry_Price",
-            "est_slippage_cost": "Est_Slippage_Cost",
-            "capacity_usage": "Capacity_Usage",
-            "significance": "Significance",
-        }
+        missing_cols = [c for c in _COL_ORDER if c in missing]
+        raise ValueError(f"Missing required candidate columns: {missing_cols}")
+
+    # Only the sheet's columns are gathered, never the caller's full frame.
+    projected = candidates.loc[:, list(_COL_ORDER)]
+
+    # One stable sort by descending score; ties keep their input order,
+    # as rank(method="first") did.
+    order = np.argsort(
+        -projected["composite_score"].to_numpy(dtype=np.float64), kind="stable"
     )
+    sheet = projected.iloc[order].reset_index(drop=True)
+    sheet.insert(0, "Rank", np.arange(1, len(sheet) + 1))
+    sheet = sheet.rename(columns=_RENAME)
 
-    with pd.ExcelWriter(filepath, engine="xlsxwriter") as writer:
-        sheet.to_excel(writer, sheet_name="Top 20 Candidates", index=False)
+    _write_sheet(filepath, "Top 20 Candidates", sheet, _COL_TYPES, _COL_WIDTHS)
 
     return filepath
 
 
+def _cell(value):
+    """
+    Map a value to what `to_excel` would write: missing values (NaN, NA,
+    NaT, None) blank, inf as text.
+    """
+    if isinstance(value, (float, np.floating)) and np.isinf(value):
+        return "inf" if value > 0 else "-inf"
+    if pd.api.types.is_scalar(value) and pd.isna(value):
+        return None
+    return value
+
+
+def _make_formats(wb: xlsxwriter.Workbook) -> Dict[str, xlsxwriter.format.Format]:
+    """Formats registered once per workbook and reused for every cell."""
+    return {
+        "header": wb.add_format(
+            {"bold": True, "border": 1, "align": "center", "valign": "top"}
+        ),
+        "num4": wb.add_format({"num_format": "0.0000"}),
+        "int": wb.add_format({"num_format": "0"}),
+    }
+
+
+def _write_sheet(
+    filepath: Path,
+    sheet_name: str,
+    sheet: pd.DataFrame,
+    col_types: Sequence[str],
+    col_widths: Sequence[int],
+) -> None:
+    """
+    Write `sheet` (header + rows, no index) straight through xlsxwriter.
+
+    Rows are emitted strictly in order, so the workbook can run in
+    constant_memory mode and stream each row to disk. Tickers and numbers
+    never need xlsxwriter's URL/formula detection. Each column's type
+    (`col_types`) picks a typed write call and a pre-built format, so no
+    per-cell type dispatch or format lookup happens in the row loop.
+    """
+    wb = xlsxwriter.Workbook(
+        str(filepath),
+        {
+            "constant_memory": True,
+            "strings_to_urls": False,
+            "strings_to_formulas": False,
+        },
+    )
+    try:
+        ws = wb.add_worksheet(sheet_name)
+        formats = _make_formats(wb)
+        col_formats = [formats.get(kind) for kind in col_types]
+        for c, (width, fmt) in enumerate(zip(col_widths, col_formats)):
+            ws.set_column(c, c, width, fmt)
+
+        ws.write_row(0, 0, list(sheet.columns), formats["header"])
+        for i, row in enumerate(sheet.itertuples(index=False), start=1):
+            for c, value in enumerate(row):
+                value = _cell(value)
+                if value is None:
+                    continue
+                kind = col_types[c]
+                if kind == "str" or isinstance(value, str):
+                    ws.write_string(i, c, str(value), col_formats[c])
+                elif kind == "auto":
+                    ws.write(i, c, value)
+                else:
+                    ws.write_number(i, c, value, col_formats[c])
+    finally:
+        wb.close()
@@ -4,10 +4,13 @@ Risk & regime utilities, including the Kill Switch logic.
 
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass
 
+import numpy as np
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class KillSwitchConfig:
     """
     Configuration for the market-regime Kill Switch.
@@ -17,6 +20,9 @@ class KillSwitchConfig:
     hist_vol_multiplier: float = 1.5
 
 
+DEFAULT_KS = KillSwitchConfig()
+
+
 def should_activate_kill_switch(
     sector_drop_1w: float,
     atr: float,
@@ -29,14 +35,44 @@ def should_activate_kill_switch(
     Kill Switch is active if:
         Sector_Drop(1W) > max(atr_multiplier * ATR,
                               hist_vol_multiplier * HistVolStd)
+
+    A NaN ATR or HistVolStd is ignored and the other term sets the
+    threshold; if both (or the drop) are NaN the switch stays off.
     """
     if config is None:
-        config = KillSwitchConfig()
+        config = DEFAULT_KS
 
-    threshold = max(
-        config.atr_multiplier * atr,
-        config.hist_vol_multiplier * hist_vol_std,
-    )
+    # Plain floats: a NumPy round trip costs more than the rule itself.
+    atr_term = config.atr_multiplier * atr
+    vol_term = config.hist_vol_multiplier * hist_vol_std
+    if math.isnan(atr_term):
+        threshold = vol_term
+    elif math.isnan(vol_term):
+        threshold = atr_term
+    else:
+        threshold = max(atr_term, vol_term)
     return sector_drop_1w > threshold
 
 
+def should_activate_kill_switch_arr(
+    sector_drop_1w: np.ndarray,
+    atr: np.ndarray,
+    hist_vol_std: np.ndarray,
+    config: KillSwitchConfig | None = None,
+) -> np.ndarray:
+    """
+    Vectorized `should_activate_kill_switch` over aligned arrays.
+
+    Evaluates the rule for every (date, sector) at once and returns a
+    boolean array, with the same NaN handling as the scalar rule.
+    """
+    if config is None:
+        config = DEFAULT_KS
+
+    threshold = np.fmax(
+        config.atr_multiplier * np.asarray(atr, dtype=np.float64),
+        config.hist_vol_multiplier * np.asarray(hist_vol_std, dtype=np.float64),
+    )
+    return np.asarray(sector_drop_1w, dtype=np.float64) > threshold
+
+
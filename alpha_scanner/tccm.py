@@ -16,8 +16,22 @@ from dataclasses import dataclass
 import numpy as np
 import pandas as pd
 
+from .factors._njit import HAS_NUMBA
+from .factors.utils import simple_moving_average
+from .market_arrays import MarketArrays
 
-@dataclass
+try:
+    # Precompiled by `python -m alpha_scanner._tccm_aot`; no JIT warmup.
+    from ._tccm_native import costs_and_capacity_loop
+
+    _HAS_FUSED_KERNEL = True
+except ImportError:
+    from .tccm_kernels import costs_and_capacity_loop
+
+    _HAS_FUSED_KERNEL = HAS_NUMBA
+
+
+@dataclass(frozen=True, slots=True)
 class TCCMConfig:
     commission_per_share: float = 0.0
     calibration_constant: float = 0.005  # 50 bps as decimal
@@ -25,24 +39,145 @@ class TCCMConfig:
     adv_window: int = 20
 
 
+# Shared default; the config is frozen, so one instance serves every call.
+DEFAULT_TCCM = TCCMConfig()
+
+
 def compute_adv(volume: pd.Series, window: int) -> pd.Series:
     """
     Compute Average Daily Volume (ADV) per (date, ticker).
+
+    Returned in `volume`'s own row order. With numba installed this is a
+    single running-sum pass over the ticker-contiguous volumes (see
+    `factors.utils.simple_moving_average`); otherwise a groupby rolling
+    mean.
+    """
+    return simple_moving_average(volume, window)
+
+
+def trade_costs_from_arrays(
+    delta_shares: np.ndarray,
+    prices: np.ndarray,
+    adv: np.ndarray,
+    volatility: np.ndarray,
+    config: TCCMConfig | None = None,
+) -> np.ndarray:
+    """
+    Commission + MIC for position changes on aligned arrays.
+
+    All inputs must have the same shape (e.g. (date x ticker) panels or
+    aligned long columns). Missing MIC inputs cost nothing, as in
+    `estimate_trade_costs`.
+    """
+    if config is None:
+        config = DEFAULT_TCCM
+
+    dollar_size = delta_shares * prices
+    commission = delta_shares * config.commission_per_share
+
+    # Zero ADV leaves NaN in place (no impact charged) without building a
+    # NaN-substituted copy of `adv`. Volumes are non-negative, so a
+    # negative ADV can only be rounding residue and is treated as zero.
+    size_over_adv = np.full(np.shape(dollar_size), np.nan)
+    np.divide(dollar_size, adv, out=size_over_adv, where=adv > 0)
+    # Linear impact skips the power entirely; NumPy already fast-paths
+    # x ** 0.5 and a vectorized pow beats sqrt products for other alphas.
+    with np.errstate(invalid="ignore"):
+        impact = (
+            size_over_adv
+            if config.impact_alpha == 1.0
+            else np.power(size_over_adv, config.impact_alpha)
+        )
+        mic = config.calibration_constant * impact * volatility
+
+    return commission + np.where(np.isnan(mic), 0.0, mic)
+
+
+def _shares_index(series: pd.Series, index: pd.Index) -> bool:
+    return series.index is index or series.index.equals(index)
+
+
+def _as_aligned_arrays(index: pd.Index, *series: pd.Series) -> list[np.ndarray]:
+    """
+    float64 arrays of `series`, positioned on `index`.
+
+    Inputs cut from one frame already share `index` and are read as is;
+    anything else is reindexed once here, so callers do all arithmetic on
+    raw arrays without pandas alignment.
+    """
+    return [
+        (s if _shares_index(s, index) else s.reindex(index)).to_numpy(
+            dtype=np.float64
+        )
+        for s in series
+    ]
+
+
+def _can_fuse(index: pd.Index, volume: pd.Series) -> bool:
+    """
+    Whether the fused kernel applies: an AOT-built or JIT kernel exists and
+    `volume` lives on the (date, ticker) rows being costed, so its rolling
+    ADV can be taken in the same pass.
     """
     return (
-        volume.groupby(level="ticker")
-        .rolling(window=window, min_periods=window)
-        .mean()
-        .reset_index(level=0, drop=True)
+        _HAS_FUSED_KERNEL
+        and isinstance(index, pd.MultiIndex)
+        and _shares_index(volume, index)
     )
 
 
+def _market_costs_and_capacity(
+    market: MarketArrays,
+    positions_prev: np.ndarray,
+    positions_next: np.ndarray,
+    volatility: np.ndarray,
+    config: TCCMConfig,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Trade cost and capacity usage for positions in `market` row order.
+    """
+    n = len(market)
+    if _HAS_FUSED_KERNEL:
+        cost = np.empty(n)
+        capacity = np.empty(n)
+        costs_and_capacity_loop(
+            market.bounds,
+            positions_prev,
+            positions_next,
+            market.price,
+            market.volume,
+            volatility,
+            config.adv_window,
+            config.commission_per_share,
+            config.calibration_constant,
+            config.impact_alpha,
+            cost,
+            capacity,
+        )
+        return cost, capacity
+
+    volume = pd.Series(market.restore(market.volume), index=market.index)
+    adv = market.take(compute_adv(volume, window=config.adv_window))
+    cost = trade_costs_from_arrays(
+        delta_shares=np.abs(positions_next - positions_prev),
+        prices=market.price,
+        adv=adv,
+        volatility=volatility,
+        config=config,
+    )
+    capacity = np.full(n, np.nan)
+    np.divide(
+        np.abs(positions_next) * market.price, adv, out=capacity, where=adv > 0
+    )
+    return cost, capacity
+
+
 def estimate_trade_costs(
     positions_prev: pd.Series,
     positions_next: pd.Series,
-    prices: pd.Series,
-    volume: pd.Series,
-    volatility: pd.Series,
+    prices: pd.Series | MarketArrays,
+    volume: pd.Series | None = None,
+    volatility: pd.Series | None = None,
     config: TCCMConfig | None = None,
 ) -> pd.Series:
     """
@@ -51,53 +186,112 @@ def estimate_trade_costs(
     Parameters
     ----------
     positions_prev, positions_next:
-        Position sizes in shares per (date, ticker).
+        Position sizes in shares per (date, ticker). The result is indexed
+        like `positions_next` (or like the MarketArrays); the other inputs
+        are aligned to it.
     prices:
-        Close prices per (date, ticker).
+        Close prices per (date, ticker), or `MarketArrays` carrying
+        prices, volume and volatility (then `volume`/`volatility` are
+        ignored).
+        Passing MarketArrays built once skips regrouping on repeated calls.
     volume:
         Traded volume per (date, ticker) (shares).
     volatility:
         Volatility proxy (e.g., ATR or stdev) per (date, ticker).
     """
     if config is None:
-        config = TCCMConfig()
-
-    delta_shares = (positions_next - positions_prev).abs()
-    dollar_size = delta_shares * prices
+        config = DEFAULT_TCCM
 
-    adv = compute_adv(volume, window=config.adv_window)
+    if isinstance(prices, MarketArrays):
+        market = prices
+        if market.volatility is None:
+            raise ValueError(
+                "MarketArrays need a volatility array to estimate costs"
+            )
+    else:
+        if volume is None or volatility is None:
+            raise ValueError("volume and volatility are required with Series prices")
+        index = positions_next.index
+        if not _can_fuse(index, volume):
+            return _estimate_trade_costs_unfused(
+                positions_prev, positions_next, prices, volume, volatility, config
+            )
+        market = MarketArrays.from_series(prices, volume, volatility, index=index)
 
-    commission = delta_shares * config.commission_per_share
+    cost, _ = _market_costs_and_capacity(
+        market,
+        market.take(positions_prev),
+        market.take(positions_next),
+        market.volatility,
+        config,
+    )
+    return pd.Series(market.restore(cost), index=market.index, name="trade_cost")
 
-    with np.errstate(divide="ignore", invalid="ignore"):
-        size_over_adv = dollar_size / adv.replace(0, np.nan)
-        mic = (
-            config.calibration_constant
-            * (size_over_adv ** config.impact_alpha)
-            * volatility
-        )
 
-    cost = commission + mic.fillna(0.0)
-    cost.name = "trade_cost"
-    return cost
+def _estimate_trade_costs_unfused(
+    positions_prev: pd.Series,
+    positions_next: pd.Series,
+    prices: pd.Series,
+    volume: pd.Series,
+    volatility: pd.Series,
+    config: TCCMConfig,
+) -> pd.Series:
+    """
+    `estimate_trade_costs` with ADV taken over `volume`'s own rows.
+    """
+    index = positions_next.index
+    prev, nxt, px, volat = _as_aligned_arrays(
+        index, positions_prev, positions_next, prices, volatility
+    )
+    (adv,) = _as_aligned_arrays(index, compute_adv(volume, window=config.adv_window))
+    cost = trade_costs_from_arrays(
+        delta_shares=np.abs(nxt - prev),
+        prices=px,
+        adv=adv,
+        volatility=volat,
+        config=config,
+    )
+    return pd.Series(cost, index=index, name="trade_cost")
 
 
 def compute_capacity_usage(
     positions: pd.Series,
-    prices: pd.Series,
-    volume: pd.Series,
+    prices: pd.Series | MarketArrays,
+    volume: pd.Series | None = None,
     config: TCCMConfig | None = None,
 ) -> pd.Series:
     """
     Compute Capacity_Usage = OrderSize / ADV.
+
+    `prices` may be `MarketArrays` carrying prices and volume (then
+    `volume` is ignored). The result is indexed like `positions` (or like
+    the MarketArrays).
     """
     if config is None:
-        config = TCCMConfig()
-
-    dollar_size = positions.abs() * prices
-    adv = compute_adv(volume, window=config.adv_window)
-    capacity_usage = dollar_size / adv.replace(0, np.nan)
-    capacity_usage.name = "capacity_usage"
-    return capacity_usage
+        config = DEFAULT_TCCM
 
+    if isinstance(prices, MarketArrays):
+        market = prices
+    else:
+        if volume is None:
+            raise ValueError("volume is required with Series prices")
+        index = positions.index
+        if not _can_fuse(index, volume):
+            pos, px = _as_aligned_arrays(index, positions, prices)
+            (adv,) = _as_aligned_arrays(
+                index, compute_adv(volume, window=config.adv_window)
+            )
+            capacity_usage = np.full(len(index), np.nan)
+            np.divide(np.abs(pos) * px, adv, out=capacity_usage, where=adv > 0)
+            return pd.Series(capacity_usage, index=index, name="capacity_usage")
+        market = MarketArrays.from_series(prices, volume, index=index)
 
+    # No trades and zero volatility: only the ADV and capacity outputs
+    # matter here.
+    pos = market.take(positions)
+    _, capacity_usage = _market_costs_and_capacity(
+        market, pos, pos, np.zeros(len(market)), config
+    )
+    return pd.Series(
+        market.restore(capacity_usage), index=market.index, name="capacity_usage"
+    )
@@ -0,0 +1,34 @@
+import hashlib
+
+import pandas as pd
+import pytest
+
+
+@pytest.fixture(scope="session")
+def yf_download(request, tmp_path_factory):
+    """
+    `yf.download` with an on-disk Parquet cache under pytest's cache dir.
+
+    Identical calls (same args and kwargs) within a session or across
+    reruns read the stored frame instead of hitting the network. Empty
+    results (network/API trouble) are never cached. Under
+    `-p no:cacheprovider` the cache only lives for the session.
+    """
+    yf = pytest.importorskip("yfinance")
+    pytest_cache = getattr(request.config, "cache", None)
+    if pytest_cache is not None:
+        cache_dir = pytest_cache.mkdir("yfinance")
+    else:
+        cache_dir = tmp_path_factory.mktemp("yfinance")
+
+    def download(*args, **kwargs) -> pd.DataFrame:
+        key = repr((args, sorted(kwargs.items())))
+        path = cache_dir / f"{hashlib.sha256(key.encode()).hexdigest()}.parquet"
+        if path.exists():
+            return pd.read_parquet(path)
+        data = yf.download(*args, **kwargs)
+        if not data.empty:
+            data.to_parquet(path)
+        return data
+
+    return download
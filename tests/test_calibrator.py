@@ -0,0 +1,97 @@
+import numpy as np
+import pandas as pd
+
+from alpha_scanner.calibrator import BacktestConfig, backtest_weights
+from alpha_scanner.factor_engine import compute_factor_matrix
+from alpha_scanner.factors.utils import ensure_multiindex
+from alpha_scanner.tccm import TCCMConfig
+
+WEIGHTS = {
+    "RS_score": 0.4,
+    "Trend_score": 0.3,
+    "Squeeze_score": 0.2,
+    "Volume_score": 0.1,
+}
+
+
+def _make_ragged_ohlcv() -> pd.DataFrame:
+    rng = np.random.default_rng(3)
+    dates = pd.date_range("2020-01-01", periods=300, freq="B")
+    frames = []
+    for t in ["AAA", "BBB", "CCC"]:
+        close = 100.0 * np.cumprod(1 + rng.normal(0, 0.02, len(dates)))
+        frames.append(
+            pd.DataFrame(
+                {
+                    "date": dates,
+                    "ticker": t,
+                    "open": close,
+                    "high": close * 1.01,
+                    "low": close * 0.99,
+                    "close": close,
+                    "volume": rng.integers(100_000, 1_000_000, len(dates)),
+                }
+            )
+        )
+    df = pd.concat(frames, ignore_index=True)
+    # Interior gaps, a late listing and an early delisting.
+    holes = (
+        ((df["ticker"] == "AAA") & df["date"].isin(dates[[150, 151, 220]]))
+        | ((df["ticker"] == "BBB") & (df["date"] < dates[40]))
+        | ((df["ticker"] == "CCC") & (df["date"] > dates[260]))
+    )
+    return df[~holes].reset_index(drop=True)
+
+
+def _grid_reference(df: pd.DataFrame, cfg: TCCMConfig) -> pd.Series:
+    """Net daily returns on the full (date x ticker) grid, via wide frames."""
+    df = ensure_multiindex(df)
+    factors = compute_factor_matrix(df)
+    composite = sum(w * factors[col] for col, w in WEIGHTS.items())
+
+    scores = composite.unstack("ticker")
+    weights = scores.div(scores.abs().sum(axis=1).replace(0, np.nan), axis=0)
+    prices = df["close"].unstack("ticker")
+    positions = (weights.fillna(0.0) / prices).fillna(0.0)
+    positions_prev = positions.shift(1).fillna(0.0)
+
+    rets = np.log(prices / prices.shift(1))
+    vol = rets.rolling(20, min_periods=20).std()
+    adv = (
+        df["volume"]
+        .astype(float)
+        .groupby(level="ticker")
+        .rolling(cfg.adv_window, min_periods=cfg.adv_window)
+        .mean()
+        .reset_index(level=0, drop=True)
+        .unstack("ticker")
+    )
+
+    delta = (positions - positions_prev).abs()
+    mic = cfg.calibration_constant * (delta * prices / adv) ** cfg.impact_alpha * vol
+    costs = delta * cfg.commission_per_share + mic.fillna(0.0)
+    return (positions_prev * rets).sum(axis=1) - costs.sum(axis=1)
+
+
+def test_ragged_backtest_matches_full_grid():
+    """
+    Missing (date, ticker) rows hold a zero position: leaving and
+    re-entering a name across a gap pays costs, and no return is earned
+    across it.
+    """
+    df = _make_ragged_ohlcv()
+    cfg = TCCMConfig(
+        commission_per_share=0.01,
+        calibration_constant=0.05,
+        impact_alpha=0.75,
+        adv_window=10,
+    )
+
+    sharpe, equity = backtest_weights(df, WEIGHTS, BacktestConfig(tc_config=cfg))
+
+    expected = _grid_reference(df, cfg)
+    expected_sharpe = expected.mean() / expected.std(ddof=0) * np.sqrt(252)
+    np.testing.assert_allclose(sharpe, expected_sharpe, rtol=1e-6)
+    np.testing.assert_allclose(
+        equity.to_numpy(), (1.0 + expected).cumprod().to_numpy(), rtol=1e-9
+    )
@@ -0,0 +1,35 @@
+import numpy as np
+import pandas as pd
+
+from alpha_scanner.data_snapshot import save_raw_snapshot
+
+
+def test_snapshot_not_larger_than_default_parquet(tmp_path):
+    """
+    Snapshots must not grow relative to a default (Snappy) Parquet write
+    of the same OHLCV frame.
+    """
+    rng = np.random.default_rng(0)
+    dates = pd.date_range("2020-01-01", periods=500, freq="B")
+    tickers = [f"T{i:03d}" for i in range(100)]
+    n = len(dates) * len(tickers)
+    # Cent-rounded random walks repeat prices often, as real quotes do.
+    steps = rng.normal(0.0, 0.05, (len(tickers), len(dates)))
+    close = np.round(50.0 + np.cumsum(steps, axis=1), 2).reshape(-1)
+    df = pd.DataFrame(
+        {
+            "date": np.tile(dates.date, len(tickers)),
+            "ticker": np.repeat(tickers, len(dates)),
+            "open": np.round(close - 0.05, 2),
+            "high": np.round(close + 0.10, 2),
+            "low": np.round(close - 0.10, 2),
+            "close": close,
+            "volume": rng.integers(1, 10_000, n) * 100,
+        }
+    )
+
+    default_path = tmp_path / "default.parquet"
+    df.to_parquet(default_path, engine="pyarrow")
+    snapshot = save_raw_snapshot(df, tmp_path)
+
+    assert snapshot.stat().st_size <= default_path.stat().st_size
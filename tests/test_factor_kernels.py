@@ -0,0 +1,232 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from alpha_scanner import factors
+from alpha_scanner.factors import utils
+from alpha_scanner.factors.momentum import _rsi, _stochastic_k
+from alpha_scanner.factors.rs import RSConfig, compute_rs_score
+from alpha_scanner.factors.utils import (
+    FactorCache,
+    build_panels,
+    ensure_multiindex,
+    rolling_std,
+    simple_moving_average,
+    ticker_group_order,
+)
+
+
+def _make_ohlc() -> pd.DataFrame:
+    rng = np.random.default_rng(1)
+    frames = []
+    for t, n in [("AAA", 60), ("BBB", 45), ("CCC", 10)]:
+        close = np.round(100.0 * np.cumprod(1 + rng.normal(0, 0.01, n)), 1)
+        close[5:9] = close[4]  # flat stretch -> zero down-moves
+        frames.append(
+            pd.DataFrame(
+                {
+                    "date": pd.date_range("2020-01-01", periods=n, freq="B"),
+                    "ticker": t,
+                    "high": close * 1.01,
+                    "low": close * 0.99,
+                    "close": close,
+                }
+            )
+        )
+    return ensure_multiindex(pd.concat(frames, ignore_index=True))
+
+
+def _grouped_rolling(series: pd.Series, period: int, how: str) -> pd.Series:
+    rolled = series.groupby(level="ticker").rolling(period, min_periods=period)
+    return getattr(rolled, how)().reset_index(level=0, drop=True)
+
+
+def test_rsi_kernel_matches_pandas_reference():
+    df = _make_ohlc()
+    diff = df["close"].groupby(level="ticker").diff()
+    roll_up = _grouped_rolling(diff.clip(lower=0.0), 14, "mean")
+    roll_down = _grouped_rolling(-diff.clip(upper=0.0), 14, "mean")
+    expected = 100.0 - 100.0 / (1.0 + roll_up / roll_down.replace(0, np.nan))
+
+    result = _rsi(df["close"], 14)
+
+    pd.testing.assert_series_equal(
+        result, expected.reindex(df.index), check_names=False
+    )
+
+
+def test_stochastic_kernel_matches_pandas_reference():
+    df = _make_ohlc()
+    rolling_high = _grouped_rolling(df["high"], 14, "max")
+    rolling_low = _grouped_rolling(df["low"], 14, "min")
+    expected = (df["close"] - rolling_low) / (rolling_high - rolling_low)
+
+    result = _stochastic_k(df, 14)
+
+    pd.testing.assert_series_equal(
+        result, expected.reindex(df.index), check_names=False
+    )
+
+
+def test_grouped_sma_matches_pandas_reference():
+    df = _make_ohlc()
+    close = df["close"].copy()
+    close.iloc[20] = np.nan  # a gap delays the next full window
+    expected = _grouped_rolling(close, 5, "mean")
+
+    result = simple_moving_average(
+        close, 5, groups=ticker_group_order(close.index)
+    )
+
+    pd.testing.assert_series_equal(
+        result, expected.reindex(df.index), check_names=False
+    )
+
+
+@pytest.mark.parametrize("fast", [True, False])
+def test_grouped_rolling_with_unsorted_ticker_level(monkeypatch, fast):
+    """
+    `DataFrame.stack()` leaves the ticker level in column order; grouped
+    helpers must still match `groupby(level="ticker")`.
+    """
+    if not fast:
+        monkeypatch.setattr(utils, "HAS_NUMBA", False)
+        monkeypatch.setattr(utils, "bn", None)
+    rng = np.random.default_rng(4)
+    wide = pd.DataFrame(
+        rng.normal(100.0, 5.0, size=(30, 3)),
+        index=pd.date_range("2020-01-01", periods=30, freq="B", name="date"),
+        columns=pd.Index(["ZZZ", "AAA", "MMM"], name="ticker"),
+    )
+    wide.iloc[7, 1] = np.nan
+    volume = wide.stack().rename("volume")
+    assert not volume.index.levels[1].is_monotonic_increasing
+
+    for how, result in [
+        ("mean", simple_moving_average(volume, 5)),
+        ("std", rolling_std(volume, 5)),
+    ]:
+        expected = _grouped_rolling(volume, 5, how)
+        pd.testing.assert_series_equal(
+            result, expected.reindex(volume.index), check_names=False
+        )
+
+
+def _make_dense_ohlcv(n_dates: int = 300, n_tickers: int = 4) -> pd.DataFrame:
+    rng = np.random.default_rng(2)
+    dates = pd.date_range("2000-01-01", periods=n_dates, freq="B")
+    frames = []
+    for t in [f"T{i:02d}" for i in range(n_tickers)]:
+        close = 100.0 * np.cumprod(1 + rng.normal(0, 0.01, len(dates)))
+        frames.append(
+            pd.DataFrame(
+                {
+                    "date": dates,
+                    "ticker": t,
+                    "open": close,
+                    "high": close * 1.01,
+                    "low": close * 0.99,
+                    "close": close,
+                    "volume": rng.integers(100_000, 1_000_000, len(dates)),
+                }
+            )
+        )
+    return ensure_multiindex(pd.concat(frames, ignore_index=True))
+
+
+def _long_path(monkeypatch, compute, df: pd.DataFrame) -> pd.Series:
+    """`compute(df)` in float64 with the dense panel layout disabled."""
+    with monkeypatch.context() as m:
+        m.setattr(utils, "build_panels", lambda *args, **kwargs: None)
+        return compute(df).reindex(df.index)
+
+
+@pytest.mark.parametrize("name", ["rs", "trend", "squeeze", "momentum", "volume"])
+def test_panel_fast_path_matches_long_path(monkeypatch, name):
+    df = _make_dense_ohlcv()
+    compute = getattr(factors, f"compute_{name}_score")
+
+    result = compute(df, cache=FactorCache(df, dtype=np.float32))
+    assert FactorCache(df).panels is not None
+    expected = _long_path(monkeypatch, compute, df)
+
+    np.testing.assert_allclose(
+        result.to_numpy(dtype=np.float64),
+        expected.to_numpy(),
+        rtol=1e-3,
+        atol=1e-3,
+    )
+
+
+@pytest.mark.parametrize("use_bottleneck", [True, False])
+def test_panel_fast_path_long_history(monkeypatch, use_bottleneck):
+    """
+    Running sums over float32 panels must not drift with history length;
+    after 5,000 days the scores still match the float64 long path.
+    """
+    if not use_bottleneck:
+        monkeypatch.setattr(utils, "bn", None)
+    df = _make_dense_ohlcv(n_dates=5_000, n_tickers=12)
+    compute = factors.compute_squeeze_score
+
+    result = compute(df, cache=FactorCache(df, dtype=np.float32))
+    expected = _long_path(monkeypatch, compute, df)
+
+    np.testing.assert_allclose(
+        result.to_numpy(dtype=np.float64),
+        expected.to_numpy(),
+        rtol=1e-3,
+        atol=1e-3,
+    )
+
+
+@pytest.mark.parametrize("dense", [True, False])
+def test_rs_benchmark_with_gaps_matches_ffill_reference(monkeypatch, dense):
+    """
+    A benchmark that starts late and misses interior dates is forward
+    filled onto the universe's dates before its ROC is taken.
+    """
+    df = _make_dense_ohlcv()
+    dates = df.index.get_level_values("date").unique()
+    rng = np.random.default_rng(5)
+    bench = pd.Series(
+        100.0 * np.cumprod(1 + rng.normal(0, 0.01, len(dates))), index=dates
+    )
+    bench = bench.iloc[30:].drop(dates[[60, 61, 62, 140, 299]])
+    config = RSConfig()
+
+    bench_ff = bench.reindex(dates, method="ffill")
+    close = df["close"].unstack("ticker")
+
+    def roc(x, window):
+        return (x / x.shift(window) - 1.0) * 100.0
+
+    expected = sum(
+        weight * roc(close, window).sub(roc(bench_ff, window), axis=0)
+        for weight, window in [
+            (0.1, config.short_window),
+            (0.3, config.mid_window),
+            (0.3, config.long_window),
+            (0.3, config.very_long_window),
+        ]
+    ).stack(future_stack=True)
+
+    if dense:
+        result = compute_rs_score(df, benchmark_prices=bench, config=config)
+    else:
+        result = _long_path(
+            monkeypatch,
+            lambda frame: compute_rs_score(
+                frame, benchmark_prices=bench, config=config
+            ),
+            df,
+        )
+
+    pd.testing.assert_series_equal(
+        result, expected.reindex(df.index), check_names=False
+    )
+
+
+def test_build_panels_rejects_ragged_frames():
+    df = _make_dense_ohlcv()
+    assert build_panels(df.iloc[1:]) is None
@@ -2,13 +2,12 @@ import datetime as dt
 
 import pandas as pd
 import pytest
-import yfinance as yf
 
 from alpha_scanner.factor_engine import compute_factor_matrix
 
 
 @pytest.mark.integration
-def test_yfinance_connectivity_and_basic_schema():
+def test_yfinance_connectivity_and_basic_schema(yf_download):
     """
     Integration: verify that yfinance can download data and returns
     a non-empty DataFrame with expected OHLCV columns.
@@ -16,7 +15,7 @@ def test_yfinance_connectivity_and_basic_schema():
     end = dt.date.today()
     start = end - dt.timedelta(days=10)
 
-    df = yf.download("SPY", start=start, end=end, interval="1d", auto_adjust=False)
+    df = yf_download("SPY", start=start, end=end, interval="1d", auto_adjust=False)
 
     # Basic connectivity / non-empty. In restricted/SSL-intercepted
     # environments yfinance may return an empty frame; in that case
@@ -31,7 +30,7 @@ def test_yfinance_connectivity_and_basic_schema():
 
 
 @pytest.mark.integration
-def test_factor_engine_with_yfinance_data():
+def test_factor_engine_with_yfinance_data(yf_download):
     """
     Integration: pull real data via yfinance, transform it into the
     internal OHLCV format, and ensure the factor engine returns a
@@ -41,45 +40,36 @@ def test_factor_engine_with_yfinance_data():
     end = dt.date.today()
     start = end - dt.timedelta(days=60)
 
-    data = yf.download(tickers, start=start, end=end, interval="1d", auto_adjust=False)
+    data = yf_download(tickers, start=start, end=end, interval="1d", auto_adjust=False)
 
     # If data is empty (e.g. due to network issues), mark as skip.
     if data.empty:
         pytest.skip("yfinance returned empty data (possible network or API issue)")
 
-    # yfinance multi-ticker format: columns are a MultiIndex (field, ticker)
-    rows = []
-    for date, row in data.iterrows():
-        for t in tickers:
-            try:
-                open_ = row[("Open", t)]
-                high = row[("High", t)]
-                low = row[("Low", t)]
-                close = row[("Close", t)]
-                volume = row[("Volume", t)]
-            except KeyError:
-                continue
-
-            if pd.isna(close) or pd.isna(volume):
-                continue
-
-            rows.append(
-                {
-                    "date": date.date(),
-                    "ticker": t,
-                    "open": float(open_),
-                    "high": float(high),
-                    "low": float(low),
-                    "close": float(close),
-                    "volume": float(volume),
-                }
-            )
-
-    if not rows:
+    # yfinance multi-ticker format: columns are a MultiIndex (field, ticker).
+    # Move the ticker level into the rows in one reshape.
+    fields = {
+        "Open": "open",
+        "High": "high",
+        "Low": "low",
+        "Close": "close",
+        "Volume": "volume",
+    }
+    df_ohlcv = (
+        data.stack(level=1, future_stack=True)
+        .rename_axis(["date", "ticker"])
+        .reset_index()
+        .rename(columns=fields)
+    )
+    df_ohlcv = df_ohlcv[["date", "ticker", *fields.values()]].dropna(
+        subset=["close", "volume"]
+    )
+    df_ohlcv = df_ohlcv.astype({c: float for c in fields.values()})
+    df_ohlcv["date"] = df_ohlcv["date"].dt.date
+
+    if df_ohlcv.empty:
         pytest.skip("No valid OHLCV rows constructed from yfinance data.")
 
-    df_ohlcv = pd.DataFrame(rows)
-
     factors = compute_factor_matrix(df_ohlcv)
 
     # Sanity checks on factor matrix
@@ -0,0 +1,104 @@
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from alpha_scanner.llm_module import LLMAlphaModule, LLMCache, LLMModuleConfig
+
+
+class CountingModule(LLMAlphaModule):
+    """Records every provider call."""
+
+    def __init__(self, config=None):
+        super().__init__(config)
+        self.calls = []
+
+    def _fetch_sentiment_scores(self, ticker, as_of_date):
+        self.calls.append((ticker, as_of_date))
+        return {"news_sentiment_short_term": float(len(self.calls))}
+
+
+def test_batch_scores_union_keys():
+    """
+    Batch frames hold every key any ticker returned; tickers missing a
+    key get NaN, as `pd.DataFrame(rows)` would give.
+    """
+    responses = {
+        "AAA": {"fund_quality_score": 1.0, "fund_valuation_score": 2.0},
+        "BBB": {"fund_quality_score": 3.0},
+        "CCC": {"fund_valuation_score": 4.0, "fund_risk_score": 5.0},
+    }
+
+    class Module(LLMAlphaModule):
+        def _fetch_fundamental_scores(self, ticker, as_of_date):
+            return dict(responses[ticker])
+
+    df = Module().get_fundamental_scores_batch(responses, date(2024, 1, 2))
+
+    expected = pd.DataFrame(
+        {
+            "fund_quality_score": [1.0, 3.0, np.nan],
+            "fund_valuation_score": [2.0, np.nan, 4.0],
+            "fund_risk_score": [np.nan, np.nan, 5.0],
+        },
+        index=pd.Index(["AAA", "BBB", "CCC"], name="ticker", dtype=object),
+        dtype=np.float32,
+    )
+    pd.testing.assert_frame_equal(df, expected)
+
+
+def test_cache_hit_returns_copy():
+    module = CountingModule()
+    d = date(2024, 1, 2)
+
+    first = module.get_sentiment_scores("AAA", d)
+    first["news_sentiment_short_term"] = -99.0
+    second = module.get_sentiment_scores("AAA", d)
+
+    assert module.calls == [("AAA", d)]
+    assert second == {"news_sentiment_short_term": 1.0}
+
+
+def test_cache_misses_on_new_date_or_prompt_version():
+    cache = LLMCache()
+    d1, d2 = date(2024, 1, 2), date(2024, 1, 3)
+
+    module = CountingModule()
+    module.cache = cache
+    module.get_sentiment_scores("AAA", d1)
+    module.get_sentiment_scores("AAA", d2)
+    module.get_sentiment_scores("BBB", d1)
+    module.get_fundamental_scores("AAA", d1)  # other kind, separate key
+    assert module.calls == [("AAA", d1), ("AAA", d2), ("BBB", d1)]
+
+    bumped = CountingModule(LLMModuleConfig(prompt_version="v1"))
+    bumped.cache = cache
+    bumped.get_sentiment_scores("AAA", d1)
+    assert bumped.calls == [("AAA", d1)]
+    assert ("sentiment", "AAA", d1, "v0") in cache.exact
+    assert ("sentiment", "AAA", d1, "v1") in cache.exact
+
+
+def test_cache_disabled_always_fetches():
+    module = CountingModule(LLMModuleConfig(cache_enabled=False))
+    d = date(2024, 1, 2)
+
+    module.get_sentiment_scores("AAA", d)
+    module.get_sentiment_scores("AAA", d)
+
+    assert module.cache is None
+    assert module.calls == [("AAA", d), ("AAA", d)]
+
+
+def test_disk_cache_survives_new_module(tmp_path):
+    pytest.importorskip("diskcache")
+    config = LLMModuleConfig(cache_dir=str(tmp_path))
+    d = date(2024, 1, 2)
+
+    CountingModule(config).get_sentiment_scores("AAA", d)
+    module = CountingModule(config)
+    scores = module.get_sentiment_scores("AAA", d)
+
+    assert module.calls == []
+    assert scores == {"news_sentiment_short_term": 1.0}
@@ -14,24 +14,20 @@ def test_qa01_cost_model_fidelity():
     unrealistically high.
     """
     dates = pd.date_range("2020-01-01", periods=200, freq="B")
-    rows = []
-    price = 100.0
     rng = np.random.default_rng(0)
-    for d in dates:
-        ret = 0.0005 + rng.normal(0, 0.01)
-        price *= 1 + ret
-        rows.append(
-            {
-                "date": d.date(),
-                "ticker": "ILLQ",
-                "open": price,
-                "high": price * 1.01,
-                "low": price * 0.99,
-                "close": price,
-                "volume": 50_000,
-            }
-        )
-    df = pd.DataFrame(rows)
+    rets = 0.0005 + rng.normal(0, 0.01, size=len(dates))
+    close = 100.0 * np.cumprod(1 + rets)
+    df = pd.DataFrame(
+        {
+            "date": dates.date,
+            "ticker": "ILLQ",
+            "open": close,
+            "high": close * 1.01,
+            "low": close * 0.99,
+            "close": close,
+            "volume": 50_000,
+        }
+    )
 
     tc_config = TCCMConfig(
         commission_per_share=0.01,
@@ -1,4 +1,10 @@
-from alpha_scanner.risk import KillSwitchConfig, should_activate_kill_switch
+import numpy as np
+
+from alpha_scanner.risk import (
+    KillSwitchConfig,
+    should_activate_kill_switch,
+    should_activate_kill_switch_arr,
+)
 
 
 def test_qa02_synthetic_regime_flip():
@@ -17,3 +23,19 @@ def test_qa02_synthetic_regime_flip():
     assert should_activate_kill_switch(sector_drop, atr, hist_vol, cfg)
 
 
+def test_qa02_vectorized_matches_scalar():
+    # The last rows carry a NaN drop, hist vol, ATR, or both volatilities.
+    drops = np.array([0.05, 0.01, 0.03, np.nan, 0.05, 0.05, 0.01, 0.05])
+    atrs = np.array([0.01, 0.01, 0.015, 0.01, 0.01, np.nan, np.nan, np.nan])
+    hist_vols = np.array([0.015, 0.02, 0.01, 0.01, np.nan, 0.01, 0.01, np.nan])
+
+    flags = should_activate_kill_switch_arr(drops, atrs, hist_vols)
+
+    expected = [
+        should_activate_kill_switch(d, a, h)
+        for d, a, h in zip(drops, atrs, hist_vols)
+    ]
+    np.testing.assert_array_equal(flags, expected)
+    np.testing.assert_array_equal(
+        flags, [True, False, False, False, True, True, False, False]
+    )
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 
 from alpha_scanner.factor_engine import compute_factor_matrix
@@ -12,21 +13,18 @@ def test_qa03_survivorship_injection():
     silently dropping them).
     """
     dates = pd.date_range("2020-01-01", periods=10, freq="B")
-    rows = []
-    for t in ["ALIVE", "DEL_1", "DEL_2"]:
-        for d in dates:
-            rows.append(
-                {
-                    "date": d.date(),
-                    "ticker": t,
-                    "open": 100.0,
-                    "high": 101.0,
-                    "low": 99.0,
-                    "close": 100.0,
-                    "volume": 1_000_000,
-                }
-            )
-    df = pd.DataFrame(rows)
+    tickers = ["ALIVE", "DEL_1", "DEL_2"]
+    df = pd.DataFrame(
+        {
+            "date": np.tile(dates.date, len(tickers)),
+            "ticker": np.repeat(tickers, len(dates)),
+            "open": 100.0,
+            "high": 101.0,
+            "low": 99.0,
+            "close": 100.0,
+            "volume": 1_000_000,
+        }
+    )
 
     factors = compute_factor_matrix(df)
 
@@ -1,6 +1,15 @@
+import numpy as np
 import pandas as pd
 
-from alpha_scanner.tccm import TCCMConfig, compute_capacity_usage
+from alpha_scanner.factors.utils import move_mean
+from alpha_scanner.market_arrays import MarketArrays
+from alpha_scanner.tccm import (
+    TCCMConfig,
+    compute_adv,
+    compute_capacity_usage,
+    estimate_trade_costs,
+    trade_costs_from_arrays,
+)
 
 
 def test_qa04_liquidity_shock():
@@ -34,7 +43,7 @@ def test_qa04_liquidity_shock():
         prices=df["close"],
         volume=df["volume"],
         config=cfg,
-    ).unstack("ticker")["AAA"]
+    ).xs("AAA", level="ticker")
 
     before = cap_usage.iloc[25]
     after = cap_usage.iloc[-1]
@@ -42,3 +51,92 @@ def test_qa04_liquidity_shock():
     assert after > before
 
 
+def test_qa04_market_arrays_match_pandas_reference():
+    """
+    Capacity usage and trade costs from prebuilt `MarketArrays` and from
+    Series both match a plain groupby/rolling reference on a ragged
+    universe.
+    """
+    rng = np.random.default_rng(5)
+    dates = pd.date_range("2020-01-01", periods=40, freq="B")
+    index = pd.MultiIndex.from_product(
+        [dates, ["AAA", "BBB"]], names=["date", "ticker"]
+    )
+    index = index.delete([10, 11, 31])  # ragged: a few (date, ticker) holes
+    close = pd.Series(rng.uniform(50.0, 150.0, len(index)), index=index)
+    volume = pd.Series(rng.uniform(1e5, 1e6, len(index)), index=index)
+    volatility = pd.Series(rng.uniform(0.01, 0.03, len(index)), index=index)
+    positions = pd.Series(rng.normal(0.0, 1_000.0, len(index)), index=index)
+    positions_prev = positions.groupby(level="ticker").shift(1).fillna(0.0)
+    cfg = TCCMConfig(
+        commission_per_share=0.01, calibration_constant=0.05, adv_window=20
+    )
+
+    adv = (
+        volume.groupby(level="ticker")
+        .rolling(cfg.adv_window, min_periods=cfg.adv_window)
+        .mean()
+        .reset_index(level=0, drop=True)
+        .reindex(index)
+    )
+    expected_capacity = positions.abs() * close / adv
+    delta = (positions - positions_prev).abs()
+    mic = (
+        cfg.calibration_constant
+        * (delta * close / adv) ** cfg.impact_alpha
+        * volatility
+    )
+    expected_cost = delta * cfg.commission_per_share + mic.fillna(0.0)
+
+    market = MarketArrays.from_series(close, volume, volatility)
+    for prices in (close, market):
+        capacity = compute_capacity_usage(positions, prices, volume, config=cfg)
+        np.testing.assert_allclose(capacity, expected_capacity, rtol=1e-12)
+        cost = estimate_trade_costs(
+            positions_prev, positions, prices, volume, volatility, config=cfg
+        )
+        np.testing.assert_allclose(cost, expected_cost, rtol=1e-12)
+
+
+def test_qa04_volume_dries_up():
+    """
+    Once a ticker stops trading, ADV is exactly zero (no running-sum
+    residue), so no impact is charged and capacity usage is undefined.
+    """
+    rng = np.random.default_rng(0)
+    volume = np.concatenate([rng.uniform(0.0, 1.0, 30) * 1_000.0 / 7.0, np.zeros(25)])
+    dates = pd.date_range("2020-01-01", periods=len(volume), freq="B")
+    index = pd.MultiIndex.from_product([dates, ["AAA"]], names=["date", "ticker"])
+    volume = pd.Series(volume, index=index)
+    close = pd.Series(10.0, index=index)
+    positions = pd.Series(np.linspace(0.0, 1.0, len(index)), index=index)
+    cfg = TCCMConfig(impact_alpha=1.0, adv_window=20)
+
+    adv = compute_adv(volume, cfg.adv_window)
+    assert (adv.iloc[-5:] == 0.0).all()
+    dense_adv = move_mean(volume.to_numpy()[:, None], cfg.adv_window)
+    assert (dense_adv[-5:] == 0.0).all()
+
+    costs = estimate_trade_costs(
+        positions_prev=positions.shift(1).fillna(0.0),
+        positions_next=positions,
+        prices=close,
+        volume=volume,
+        volatility=pd.Series(0.02, index=index),
+        config=cfg,
+    )
+    assert (costs >= 0.0).all()
+    assert (costs.iloc[-5:] == 0.0).all()
+
+    capacity = compute_capacity_usage(positions, close, volume, config=cfg)
+    assert capacity.iloc[-5:].isna().all()
+
+    # Residue reaching the array API directly is not a usable ADV either.
+    residue = trade_costs_from_arrays(
+        delta_shares=np.ones(2),
+        prices=np.full(2, 10.0),
+        adv=np.array([-6.5e-13, 0.0]),
+        volatility=np.full(2, 0.02),
+        config=cfg,
+    )
+    np.testing.assert_array_equal(residue, 0.0)
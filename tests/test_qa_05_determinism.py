@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 
 from alpha_scanner.calibrator import BacktestConfig, calibrate_phase1
@@ -11,23 +12,19 @@ def test_qa05_determinism():
     twice should produce identical outputs (no randomness).
     """
     dates = pd.date_range("2020-01-01", periods=50, freq="B")
-    rows = []
-    for t in ["AAA", "BBB"]:
-        price = 100.0
-        for d in dates:
-            price *= 1.001
-            rows.append(
-                {
-                    "date": d.date(),
-                    "ticker": t,
-                    "open": price,
-                    "high": price * 1.01,
-                    "low": price * 0.99,
-                    "close": price,
-                    "volume": 1_000_000,
-                }
-            )
-    df = pd.DataFrame(rows)
+    tickers = ["AAA", "BBB"]
+    prices = np.tile(100.0 * 1.001 ** np.arange(1, len(dates) + 1), len(tickers))
+    df = pd.DataFrame(
+        {
+            "date": np.tile(dates.date, len(tickers)),
+            "ticker": np.repeat(tickers, len(dates)),
+            "open": prices,
+            "high": prices * 1.01,
+            "low": prices * 0.99,
+            "close": prices,
+            "volume": 1_000_000,
+        }
+    )
 
     candidate_weights = [
         {
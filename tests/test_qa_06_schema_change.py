@@ -1,7 +1,15 @@
+from datetime import date
+
 import pandas as pd
 import pytest
 
-from alpha_scanner.data_snapshot import SchemaDefinition, validate_schema
+from alpha_scanner.data_snapshot import (
+    SchemaDefinition,
+    load_raw_snapshot,
+    save_raw_snapshot,
+    validate_parquet_schema,
+    validate_schema,
+)
 
 
 def test_qa06_schema_change_negative():
@@ -29,3 +37,68 @@ def test_qa06_schema_change_negative():
         validate_schema(df_bad_dtype, schema)
 
 
+def test_qa06_schema_change_negative_parquet(tmp_path):
+    """
+    QA-06 on a saved snapshot: the Parquet footer alone is enough to
+    reject a renamed column or a changed dtype.
+    """
+    schema = SchemaDefinition(dtypes={"close": "float64", "volume": "int64"})
+
+    good = save_raw_snapshot(
+        pd.DataFrame({"close": [1.0, 2.0], "volume": [100, 200]}), tmp_path, "good"
+    )
+    validate_parquet_schema(good, schema)
+
+    # `datetime.date` columns (the QA fixtures' date format) load as object.
+    dated_schema = SchemaDefinition(
+        dtypes={"date": "object", "close": "float64", "volume": "int64"}
+    )
+    dated = pd.DataFrame(
+        {
+            "date": [date(2024, 1, 2), date(2024, 1, 3)],
+            "close": [1.0, 2.0],
+            "volume": [100, 200],
+        }
+    )
+    dated_path = save_raw_snapshot(dated, tmp_path, "dated")
+    validate_schema(load_raw_snapshot(dated_path, dated_schema), dated_schema)
+
+    bad_col = save_raw_snapshot(
+        pd.DataFrame({"close": [1.0, 2.0], "VLM": [100, 200]}), tmp_path, "bad_col"
+    )
+    with pytest.raises(ValueError):
+        validate_parquet_schema(bad_col, schema)
+
+    bad_dtype = save_raw_snapshot(
+        pd.DataFrame({"close": [1.0, 2.0], "volume": [100.0, 200.0]}),
+        tmp_path,
+        "bad_dtype",
+    )
+    with pytest.raises(ValueError):
+        validate_parquet_schema(bad_dtype, schema)
+
+
+def test_qa06_parquet_nullable_dtypes(tmp_path):
+    """
+    Nullable extension columns are checked against the dtype they load
+    as, not their plain Arrow storage type.
+    """
+    df = pd.DataFrame(
+        {
+            "close": [1.0, 2.0],
+            "volume": pd.array([100, None], dtype="Int64"),
+            "halted": pd.array([False, None], dtype="boolean"),
+        }
+    )
+    schema = SchemaDefinition(
+        dtypes={"close": "float64", "volume": "Int64", "halted": "boolean"}
+    )
+
+    path = save_raw_snapshot(df, tmp_path, "nullable")
+    loaded = load_raw_snapshot(path, schema)
+    validate_schema(loaded, schema)
+
+    with pytest.raises(ValueError):
+        validate_parquet_schema(
+            path, SchemaDefinition(dtypes={"close": "float64", "volume": "int64"})
+        )
@@ -0,0 +1,36 @@
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from alpha_scanner.reporter import write_scanner_results_excel
+
+
+def test_missing_and_infinite_cells(tmp_path):
+    """
+    NaN and NA cells are left blank and inf is written as text, as
+    `DataFrame.to_excel` does.
+    """
+    openpyxl = pytest.importorskip("openpyxl")
+    candidates = pd.DataFrame(
+        {
+            "ticker": ["AAA", "BBB", "CCC"],
+            "composite_score": [0.9, 0.5, 0.1],
+            "vol_adj_shares": pd.array([100, pd.NA, 300], dtype="Int64"),
+            "est_entry_price": [10.0, np.nan, 30.0],
+            "est_slippage_cost": [0.1, 0.2, np.inf],
+            "capacity_usage": [0.01, -np.inf, np.nan],
+            "significance": ["high", None, 0.05],
+        }
+    )
+
+    path = write_scanner_results_excel(tmp_path, candidates, run_date=date(2024, 1, 2))
+
+    ws = openpyxl.load_workbook(path).active
+    rows = [list(r) for r in ws.iter_rows(min_row=2, values_only=True)]
+    assert rows == [
+        [1, "AAA", 0.9, 100, 10.0, 0.1, 0.01, "high"],
+        [2, "BBB", 0.5, None, None, 0.2, "-inf", None],
+        [3, "CCC", 0.1, 300, 30.0, "inf", None, 0.05],
+    ]